@@ -12,6 +12,28 @@ Now with mouse support powered by Textual!
 __version__ = "2.0.0"
 __author__ = "AMV Toolkit"
 
-from .config import MODELS_DIR, get_output_dirs, ensure_output_dirs
-from .hardware import get_hw_info
+# Re-exports are resolved on first attribute access (PEP 562) so that
+# `import amv` doesn't pull in config/hardware until they are needed.
+_LAZY_EXPORTS = {
+    "MODELS_DIR": "config",
+    "get_output_dirs": "config",
+    "ensure_output_dirs": "config",
+    "get_hw_info": "hardware",
+    "get_accel": "hardware",
+    "get_gpu_type": "hardware",
+}
+
+
+def __getattr__(name):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_EXPORTS))
 
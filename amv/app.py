@@ -4,16 +4,22 @@
 # ═══════════════════════════════════════════════════════════════════════════════
 
 import os
+import importlib
 from pathlib import Path
 from textual.app import App
 from textual.binding import Binding
 
 from amv.screens.main import MainScreen
-from amv.screens.youtube import YouTubeScreen
-from amv.screens.vocals import VocalsScreen
-from amv.screens.convert import ConvertScreen
-from amv.screens.settings import SettingsScreen
-from amv.screens.setup import SetupScreen
+
+
+def _lazy_screen(path: str):
+    """Return a screen factory that imports "module:Class" on first use."""
+    module_name, class_name = path.split(":")
+
+    def factory():
+        return getattr(importlib.import_module(module_name), class_name)()
+
+    return factory
 
 
 class AMVApp(App):
@@ -33,11 +39,12 @@ class AMVApp(App):
     
     SCREENS = {
         "main": MainScreen,
-        "youtube": YouTubeScreen,
-        "vocals": VocalsScreen,
-        "convert": ConvertScreen,
-        "settings": SettingsScreen,
-        "setup": SetupScreen,
+        # Only the home screen is imported eagerly; the rest load on first push
+        "youtube": _lazy_screen("amv.screens.youtube:YouTubeScreen"),
+        "vocals": _lazy_screen("amv.screens.vocals:VocalsScreen"),
+        "convert": _lazy_screen("amv.screens.convert:ConvertScreen"),
+        "settings": _lazy_screen("amv.screens.settings:SettingsScreen"),
+        "setup": _lazy_screen("amv.screens.setup:SetupScreen"),
     }
     
     ENABLE_COMMAND_PALETTE = False  # Keep it simple
@@ -62,6 +69,8 @@ def run():
     """Entry point for running the AMV app."""
     # Store original directory for file operations
     os.environ['AMV_ORIGINAL_DIR'] = os.getcwd()
+    import amv.config
+    amv.config._ORIGINAL_DIR = os.environ['AMV_ORIGINAL_DIR']
     
     app = AMVApp()
     app.run()
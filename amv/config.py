@@ -3,18 +3,25 @@
 # ═══════════════════════════════════════════════════════════════════════════════
 
 import os
+import copy
 import json
+import hashlib
+import functools
+from pathlib import Path
 import logging
+import threading
+
+try:
+    import orjson
+    ORJSON_OK = True
+except ImportError:
+    ORJSON_OK = False
 
 # Paths
 SCRIPT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 MODELS_DIR = os.path.join(SCRIPT_DIR, "models")
 CONFIG_FILE = os.path.join(SCRIPT_DIR, "config.json")
 
-# Ensure models directory exists
-if not os.path.exists(MODELS_DIR):
-    os.makedirs(MODELS_DIR)
-
 # Default Config
 DEFAULT_CONFIG = {
     "recent_files": [],
@@ -23,23 +30,103 @@ DEFAULT_CONFIG = {
     "setup_type": "cpu"
 }
 
-def load_config():
-    """Load configuration from JSON. Creates default config if none exists."""
-    if not os.path.exists(CONFIG_FILE):
-        config = DEFAULT_CONFIG.copy()
-        save_config(config)
-        return config
+# Parsed config, keyed on (path, st_mtime_ns, st_size) of the file it came from.
+# Re-entrant because load_config() calls save_config() on first run.
+_CFG_LOCK = threading.RLock()
+_CFG_CACHE = {"key": None, "value": None}
+# Digest of the file contents as of stat key "key", used to skip no-op writes
+_LAST_WRITTEN = {"key": None, "digest": None}
+
+def _loads(data: bytes):
+    """Parse JSON bytes, using orjson when available."""
+    if ORJSON_OK:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _dumps(obj) -> bytes:
+    """Serialize to indented JSON bytes.
+
+    Always the stdlib format, with or without orjson, so the file on disk
+    doesn't change shape (and trip the no-op write check) with the install.
+    """
+    return json.dumps(obj, indent=4).encode("utf-8")
+
+def _stat_key(st):
+    return (CONFIG_FILE, st.st_mtime_ns, st.st_size)
+
+def _digest(buf: bytes) -> bytes:
+    return hashlib.blake2b(buf, digest_size=16).digest()
+
+def _matches_disk(buf: bytes, digest: bytes) -> bool:
+    """Return True if the config file already holds exactly buf."""
     try:
-        with open(CONFIG_FILE, 'r') as f:
-            return {**DEFAULT_CONFIG, **json.load(f)}
-    except (json.JSONDecodeError, OSError) as e:
-        logging.warning(f"Could not load config, using defaults: {e}")
-        return DEFAULT_CONFIG.copy()
+        st = os.stat(CONFIG_FILE)
+    except OSError:
+        return False
+    if st.st_size != len(buf):
+        return False
+    key = _stat_key(st)
+    if _LAST_WRITTEN["key"] != key:
+        # Written before this process started, or edited externally
+        try:
+            with open(CONFIG_FILE, 'rb') as f:
+                on_disk = _digest(f.read())
+        except OSError:
+            return False
+        _LAST_WRITTEN["key"] = key
+        _LAST_WRITTEN["digest"] = on_disk
+    return _LAST_WRITTEN["digest"] == digest
+
+def load_config():
+    """Load configuration from JSON. Creates default config if none exists.
+
+    The parsed result is cached until the file's mtime or size changes, so
+    repeated calls only cost a single stat(). Callers get their own copy.
+    """
+    with _CFG_LOCK:
+        try:
+            st = os.stat(CONFIG_FILE)
+        except FileNotFoundError:
+            config = copy.deepcopy(DEFAULT_CONFIG)
+            save_config(config)
+            return config
+        except OSError as e:
+            logging.warning(f"Could not load config, using defaults: {e}")
+            return copy.deepcopy(DEFAULT_CONFIG)
+
+        key = _stat_key(st)
+        if _CFG_CACHE["key"] == key:
+            return copy.deepcopy(_CFG_CACHE["value"])
+
+        try:
+            with open(CONFIG_FILE, 'rb') as f:
+                config = {**DEFAULT_CONFIG, **_loads(f.read())}
+        except (ValueError, TypeError, OSError) as e:
+            logging.warning(f"Could not load config, using defaults: {e}")
+            return copy.deepcopy(DEFAULT_CONFIG)
+
+        _CFG_CACHE["key"] = key
+        _CFG_CACHE["value"] = config
+        return copy.deepcopy(config)
 
 def save_config(config):
-    """Save configuration to JSON."""
-    with open(CONFIG_FILE, 'w') as f:
-        json.dump(config, f, indent=4)
+    """Save configuration to JSON. Skips the write if nothing changed."""
+    buf = _dumps(config)
+    digest = _digest(buf)
+    with _CFG_LOCK:
+        if _matches_disk(buf, digest):
+            return
+        _CFG_CACHE["key"] = None
+        with open(CONFIG_FILE, 'wb') as f:
+            f.write(buf)
+        try:
+            key = _stat_key(os.stat(CONFIG_FILE))
+        except OSError:
+            return
+        _CFG_CACHE["key"] = key
+        _CFG_CACHE["value"] = copy.deepcopy({**DEFAULT_CONFIG, **config})
+        _LAST_WRITTEN["key"] = key
+        _LAST_WRITTEN["digest"] = digest
 
 def get_recent_files():
     """Get list of recent files."""
@@ -48,23 +135,14 @@ def get_recent_files():
 def add_recent_file(path):
     """Add a file to recent files list."""
     config = load_config()
-    recents = config.get("recent_files", [])
-    
-    # Remove existing to move to top
-    if path in recents:
-        recents.remove(path)
-    
-    recents.insert(0, path)
-    
-    # Trim
-    max_count = config.get("max_recent", 10)
-    config["recent_files"] = recents[:max_count]
+
+    # Move to top (dropping any older entry and duplicates), then trim
+    recents = list(dict.fromkeys([path, *config.get("recent_files", [])]))
+    config["recent_files"] = recents[:config.get("max_recent", 10)]
     save_config(config)
 
-def get_output_dirs():
-    """Get output directories based on the directory where user ran the command."""
-    # Use original directory where user ran the command, not where script lives
-    original_dir = os.environ.get('AMV_ORIGINAL_DIR', os.getcwd())
+@functools.lru_cache(maxsize=4)
+def _dirs_for(original_dir):
     base_dir = os.path.join(original_dir, "amv-script")
     return {
         "base": base_dir,
@@ -72,16 +150,30 @@ def get_output_dirs():
         "audio": os.path.join(base_dir, "audio downloads"),
     }
 
+# Directory the user ran the command from; set by app.run() or resolved once
+_ORIGINAL_DIR: str | None = None
+
+def get_original_dir():
+    """Get the directory where the user ran the command (not where script lives)."""
+    global _ORIGINAL_DIR
+    if _ORIGINAL_DIR is None:
+        _ORIGINAL_DIR = os.environ.get('AMV_ORIGINAL_DIR', os.getcwd())
+    return _ORIGINAL_DIR
+
+def get_output_dirs():
+    """Get output directories based on the directory where user ran the command."""
+    return dict(_dirs_for(get_original_dir()))
+
+# Directories ensure_output_dirs() has already created/seen this process
+_ENSURED: set[str] = set()
+
 def ensure_output_dirs():
-    """Create output directories if they don't exist."""
+    """Create output directories (and the models directory) if they don't exist."""
     dirs = get_output_dirs()
-    for path in dirs.values():
-        if not os.path.exists(path):
-            os.makedirs(path)
+    for path in (*dirs.values(), MODELS_DIR):
+        if path in _ENSURED:
+            continue
+        # One mkdir syscall; EEXIST is swallowed instead of a stat beforehand
+        Path(path).mkdir(parents=True, exist_ok=True)
+        _ENSURED.add(path)
     return dirs
-
-# Known AI models for display names
-KNOWN_MODELS = {
-    "Kim_Vocal_2.onnx": "Kim Vocal 2 (Anime/High Pitch - Improved)",
-    "model_bs_roformer_ep_317_sdr_12.9755.ckpt": "BS-Roformer (Best Quality)"
-}
@@ -2,75 +2,210 @@
 # AMV Toolkit - GPU Detection Utilities
 # ═══════════════════════════════════════════════════════════════════════════════
 
+import os
 import sys
+import glob
+import shutil
+import functools
+import threading
 import subprocess
 
+# Resolved once; the command builders below are called on every setup check
+_PY = sys.executable
 
-def check_nvidia_gpu() -> str | None:
-    """Run nvidia-smi and return GPU name, or None if not available."""
+
+@functools.cache
+def _nvidia_smi_info() -> tuple[str | None, str | None]:
+    """Return (name, driver_version) for the first GPU from one nvidia-smi run.
+
+    Both fields come from a single --query-gpu call and are cached for the
+    process, so name and driver lookups share one spawn. Returns
+    (None, None) without spawning anything when nvidia-smi isn't on PATH;
+    the short timeout keeps a wedged driver from stalling the UI.
+    """
+    if shutil.which("nvidia-smi") is None:
+        return None, None
     try:
         result = subprocess.run(
-            ["nvidia-smi", "--query-gpu=name", "--format=csv,noheader,nounits"],
-            capture_output=True, text=True, timeout=10
+            ["nvidia-smi", "--query-gpu=name,driver_version", "--format=csv,noheader,nounits"],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, timeout=3.0
         )
-        if result.returncode == 0 and result.stdout.strip():
-            return result.stdout.strip().split("\n")[0].strip()
+        if result.returncode == 0:
+            first = result.stdout.decode("ascii", "ignore").split("\n", 1)[0]
+            name, _, driver = first.rpartition(",")
+            return name.strip() or None, driver.strip() or None
     except (FileNotFoundError, subprocess.TimeoutExpired, OSError):
         pass
-    return None
+    return None, None
+
+
+# NVML (pynvml / nvidia-ml-py) is optional; None = not tried yet
+_NVML = None
+_NVML_OK: bool | None = None
+_NVML_LOCK = threading.Lock()
+
+
+def _nvml():
+    """Return the initialized pynvml module, or None if NVML is unavailable.
+
+    nvmlInit() loads nvml.dll / libnvidia-ml.so once per process, so later
+    queries are plain function calls instead of an nvidia-smi process.
+    """
+    global _NVML, _NVML_OK
+    with _NVML_LOCK:
+        if _NVML_OK is None:
+            try:
+                import pynvml
+                pynvml.nvmlInit()
+                _NVML, _NVML_OK = pynvml, True
+            except Exception:
+                _NVML_OK = False
+        return _NVML
+
+
+@functools.cache
+def has_nvidia_hw() -> bool:
+    """False only when the system's device list shows no NVIDIA card.
+
+    Reads the PCI vendor IDs (0x10de is NVIDIA) from sysfs on Linux or the
+    registry's PCI enumeration on Windows, so non-NVIDIA machines can skip
+    NVML, nvidia-smi and the torch import. Returns True whenever it can't
+    tell (WSL, macOS, unreadable sources) so detection still runs there.
+    """
+    if sys.platform == "win32":
+        try:
+            import winreg
+            with winreg.OpenKey(
+                winreg.HKEY_LOCAL_MACHINE, r"SYSTEM\CurrentControlSet\Enum\PCI"
+            ) as key:
+                i = 0
+                while True:
+                    try:
+                        name = winreg.EnumKey(key, i)
+                    except OSError:
+                        return False  # Enumerated every device, no NVIDIA
+                    if name.upper().startswith("VEN_10DE"):
+                        return True
+                    i += 1
+        except OSError:
+            return True
+
+    # WSL exposes no real PCI tree
+    if not sys.platform.startswith("linux") or "microsoft" in os.uname().release.lower():
+        return True
+    vendors = glob.glob("/sys/bus/pci/devices/*/vendor")
+    if not vendors:
+        return True
+    for path in vendors:
+        try:
+            with open(path, "r", encoding="ascii") as f:
+                if f.read().strip().lower() == "0x10de":
+                    return True
+        except OSError:
+            return True
+    return False
 
 
-def get_torch_install_cmd(gpu: bool) -> list[str]:
+def _as_str(value) -> str | None:
+    """pynvml returns bytes in older releases and str in newer ones."""
+    if isinstance(value, bytes):
+        value = value.decode("utf-8", "ignore")
+    value = (value or "").strip()
+    return value or None
+
+
+def check_nvidia_gpu() -> str | None:
+    """Return the first NVIDIA GPU's name, or None if not available.
+
+    Uses NVML in-process when pynvml is installed, else runs nvidia-smi.
+    """
+    if not has_nvidia_hw():
+        return None
+    nvml = _nvml()
+    if nvml is not None:
+        try:
+            if nvml.nvmlDeviceGetCount() == 0:
+                return None
+            return _as_str(nvml.nvmlDeviceGetName(nvml.nvmlDeviceGetHandleByIndex(0)))
+        except Exception:
+            pass
+    return _nvidia_smi_info()[0]
+
+
+def get_nvidia_driver_version() -> str | None:
+    """Return the NVIDIA driver version, or None if not available."""
+    if not has_nvidia_hw():
+        return None
+    nvml = _nvml()
+    if nvml is not None:
+        try:
+            return _as_str(nvml.nvmlSystemGetDriverVersion())
+        except Exception:
+            pass
+    return _nvidia_smi_info()[1]
+
+
+@functools.cache
+def get_torch_install_cmd(gpu: bool) -> tuple[str, ...]:
     """Return pip install args for PyTorch (cu128 for GPU, cpu otherwise).
 
-    Returns a list of args safe for subprocess (handles paths with spaces).
+    Returns a tuple of args safe for subprocess (handles paths with spaces).
+    Cached, so the result is immutable.
     """
-    base = [sys.executable, "-m", "pip", "install",
-            "torch", "torchvision", "torchaudio", "--index-url"]
+    base = (_PY, "-m", "pip", "install",
+            "torch", "torchvision", "torchaudio", "--index-url")
     if gpu:
-        return base + ["https://download.pytorch.org/whl/cu128"]
-    return base + ["https://download.pytorch.org/whl/cpu"]
+        return base + ("https://download.pytorch.org/whl/cu128",)
+    return base + ("https://download.pytorch.org/whl/cpu",)
 
 
-def get_gpu_switch_cmds() -> list[list[str]]:
+@functools.cache
+def get_gpu_switch_cmds() -> tuple[tuple[str, ...], ...]:
     """Full command sequence to switch from CPU to GPU (RTX 50 series / cu128).
 
-    Returns list of arg-lists safe for subprocess (handles paths with spaces).
+    Returns a tuple of arg-tuples safe for subprocess (handles paths with spaces).
     1. Uninstall CPU-only torch
     2. Install CUDA 12.8 torch (SM_120 Blackwell support)
     3. Install audio-separator with GPU extras
-    
+
+    Torch stays on its own --index-url run: pip doesn't prefer one index over
+    another, so with PyPI as an extra index a newer PyPI torch would win.
+
     Note: onnxruntime is NOT uninstalled because audio-separator still needs it internally.
     """
-    py = sys.executable
-    return [
-        [py, "-m", "pip", "uninstall", "-y", "torch", "torchvision", "torchaudio"],
-        [py, "-m", "pip", "install", "torch", "torchvision", "torchaudio",
-         "--index-url", "https://download.pytorch.org/whl/cu128"],
-        [py, "-m", "pip", "install", "audio-separator[gpu]"],
-    ]
+    return (
+        (_PY, "-m", "pip", "uninstall", "-y", "torch", "torchvision", "torchaudio"),
+        get_torch_install_cmd(True),
+        (_PY, "-m", "pip", "install", "audio-separator[gpu]"),
+    )
 
 
-def get_cpu_switch_cmds() -> list[list[str]]:
+@functools.cache
+def get_cpu_switch_cmds() -> tuple[tuple[str, ...], ...]:
     """Full command sequence to switch from GPU to CPU.
 
-    Returns list of arg-lists safe for subprocess (handles paths with spaces).
+    Returns a tuple of arg-tuples safe for subprocess (handles paths with spaces).
     1. Uninstall CUDA torch
-    2. Install CPU-only torch
-    3. Install onnxruntime for ONNX model support
+    2. Install CPU-only torch from the PyTorch index
+    3. Install onnxruntime (for ONNX models) and audio-separator in one pip run
     """
-    py = sys.executable
-    return [
-        [py, "-m", "pip", "uninstall", "-y", "torch", "torchvision", "torchaudio"],
-        [py, "-m", "pip", "install", "torch", "torchvision", "torchaudio",
-         "--index-url", "https://download.pytorch.org/whl/cpu"],
-        [py, "-m", "pip", "install", "onnxruntime"],
-        [py, "-m", "pip", "install", "audio-separator"],
-    ]
+    return (
+        (_PY, "-m", "pip", "uninstall", "-y", "torch", "torchvision", "torchaudio"),
+        get_torch_install_cmd(False),
+        (_PY, "-m", "pip", "install", "onnxruntime", "audio-separator"),
+    )
 
 
+@functools.lru_cache(maxsize=1)
 def verify_cuda_torch() -> bool:
-    """Return True if PyTorch is installed and CUDA is available."""
+    """Return True if PyTorch is installed and CUDA is available.
+
+    Skips the torch import entirely on machines without an NVIDIA card.
+    Cached per process; call verify_cuda_torch.cache_clear() after an
+    install changes the torch wheel.
+    """
+    if not has_nvidia_hw():
+        return False
     try:
         import torch
         return torch.cuda.is_available()
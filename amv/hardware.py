@@ -3,6 +3,25 @@
 # Detects GPU via torch.cuda when available, falls back to nvidia-smi
 # ═══════════════════════════════════════════════════════════════════════════════
 
+import os
+import re
+import json
+import threading
+from pathlib import Path
+from concurrent.futures import Future
+
+from .config import SCRIPT_DIR
+
+# Detection results persisted across runs, keyed by driver version and the
+# install state of torch/onnxruntime. Bump HW_CACHE_VERSION when the cached
+# fields change shape.
+HW_CACHE_FILE = os.path.join(SCRIPT_DIR, "_hw_cache.json")
+HW_CACHE_VERSION = 2
+NVIDIA_PROC_VERSION = "/proc/driver/nvidia/version"
+
+_ORT_VERSION_CACHE: str | None = None
+_VERSION_RE = re.compile(r"^Version: (.*)$", re.M)
+
 # Lazy-loaded global state
 _CACHE = {
     "checked": False,
@@ -17,37 +36,195 @@ _CACHE = {
     "accel": None
 }
 
-def _ensure_init():
-    """Perform hardware detection if not already done."""
+# In-flight detection shared by concurrent callers, so only one thread pays
+# for the torch import / nvidia-smi probe while the others wait on its result.
+_DETECT_LOCK = threading.Lock()
+_DETECT_FUTURE: Future | None = None
+
+def _ensure_init(config=None, force=False):
+    """Perform hardware detection if not already done.
+
+    Args:
+        config: Already-loaded config dict, to avoid re-reading it from disk.
+        force: Detect afresh instead of restoring results from HW_CACHE_FILE.
+    """
+    global _DETECT_FUTURE
     if _CACHE["checked"]:
         return
 
-    from .config import load_config
-    config = load_config()
-    force_cpu = config.get("force_cpu", False)
+    with _DETECT_LOCK:
+        if _CACHE["checked"]:
+            return
+        future = _DETECT_FUTURE
+        owner = future is None
+        if owner:
+            future = _DETECT_FUTURE = Future()
+
+    if not owner:
+        future.result()
+        return
+
+    try:
+        _load_or_detect(config, force)
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(None)
+    finally:
+        with _DETECT_LOCK:
+            _DETECT_FUTURE = None
+
+def _nvidia_driver_version():
+    """Return the installed NVIDIA driver version string, or None."""
+    # Linux exposes this as a plain file, which is much cheaper than a fork
+    try:
+        with open(NVIDIA_PROC_VERSION) as f:
+            return f.readline().strip() or None
+    except OSError:
+        pass
+    from .gpu import get_nvidia_driver_version
+    return get_nvidia_driver_version()
+
+def _package_mtime(name):
+    """Return the mtime of an installed package's directory, or None.
+
+    pip replaces the directory on install/uninstall, so this changes whenever
+    the package does, without importing it.
+    """
+    import importlib.util
+    try:
+        spec = importlib.util.find_spec(name)
+    except (ImportError, ValueError):
+        return None
+    if spec is None or not spec.origin:
+        return None
+    try:
+        return os.stat(os.path.dirname(spec.origin)).st_mtime_ns
+    except OSError:
+        return None
+
+def _cache_signature(config):
+    """Inputs that invalidate the on-disk detection cache when they change."""
+    return {
+        "version": HW_CACHE_VERSION,
+        "driver_version": _nvidia_driver_version(),
+        "torch_spec_mtime": _package_mtime("torch"),
+        "ort_spec_mtime": _package_mtime("onnxruntime"),
+        "force_cpu": bool(config.get("force_cpu", False)),
+    }
+
+def _load_hw_cache(signature):
+    """Populate _CACHE from HW_CACHE_FILE if it matches signature."""
+    try:
+        with open(HW_CACHE_FILE, 'r') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return False
+    if not isinstance(data, dict) or data.get("signature") != signature:
+        return False
+    cached = data.get("cache")
+    if not isinstance(cached, dict) or set(cached) != set(_CACHE) - {"checked"}:
+        return False
 
-    # Check torch availability
+    hw_info = cached.get("hw_info")
+    if isinstance(hw_info, dict) and isinstance(hw_info.get("sm"), list):
+        hw_info["sm"] = tuple(hw_info["sm"])
+    _CACHE.update(cached)
+    _CACHE["checked"] = True
+    return True
+
+def _save_hw_cache(signature):
+    """Persist the current detection results to HW_CACHE_FILE."""
+    cached = {k: v for k, v in _CACHE.items() if k != "checked"}
+    # Written atomically so a crash never leaves half a file
+    tmp = f"{HW_CACHE_FILE}.tmp"
     try:
-        import torch
+        with open(tmp, 'w') as f:
+            json.dump({"signature": signature, "cache": cached}, f, indent=4)
+        os.replace(tmp, HW_CACHE_FILE)
+    except (OSError, TypeError, ValueError):
+        pass
+
+def _ort_version(spec):
+    """Return the onnxruntime version for spec, cached for the process.
+
+    Reads Version: from the dist-info METADATA next to the package, which
+    also covers onnxruntime-gpu, before falling back to importlib.metadata.
+    """
+    global _ORT_VERSION_CACHE
+    if _ORT_VERSION_CACHE is not None:
+        return _ORT_VERSION_CACHE
+
+    ver = None
+    if spec.origin:
+        site_dir = Path(spec.origin).parent.parent
+        metadata = list(site_dir.glob("onnxruntime*.dist-info/METADATA"))
+        if len(metadata) == 1:
+            try:
+                match = _VERSION_RE.search(metadata[0].read_text(encoding="utf-8", errors="replace"))
+                if match:
+                    ver = match.group(1).strip()
+            except OSError:
+                pass
+    if ver is None:
+        try:
+            from importlib.metadata import version
+            ver = version("onnxruntime")
+        except Exception:
+            return "installed"
+
+    _ORT_VERSION_CACHE = ver
+    return ver
+
+def _load_or_detect(config=None, force=False):
+    """Restore detection results from disk, or run detection and save them.
+
+    With force, the saved results are ignored (but replaced if detection
+    produces a result worth keeping).
+    """
+    if config is None:
+        from .config import load_config
+        config = load_config()
+    signature = _cache_signature(config)
+    if not force and _load_hw_cache(signature):
+        return
+    if _detect(config):
+        _save_hw_cache(signature)
+
+def _detect(config):
+    """Run hardware detection and populate _CACHE.
+
+    Returns False when the result may be a transient failure (an NVIDIA card
+    is present but the torch import failed, or CUDA torch reported no device),
+    so it shouldn't be persisted: nothing in the cache signature changes
+    when such a fault clears.
+    """
+    persist = True
+    force_cpu = config.get("force_cpu", False)
+
+    # Check torch availability WITHOUT importing it (the import takes seconds);
+    # torch itself is only imported below when GPU detection needs it
+    import importlib.util
+    if importlib.util.find_spec("torch") is not None:
         _CACHE["torch_available"] = True
-        _CACHE["torch_version"] = torch.__version__
-    except ImportError:
+        try:
+            from importlib.metadata import version
+            _CACHE["torch_version"] = version("torch")
+        except Exception:
+            _CACHE["torch_version"] = "installed"
+    else:
         _CACHE["torch_available"] = False
         _CACHE["torch_version"] = None
 
     # Check ONNX Runtime availability WITHOUT loading the DLL
     # Using find_spec avoids locking the DLL, which prevents pip install issues
     try:
-        import importlib.util
         spec = importlib.util.find_spec("onnxruntime")
         if spec is not None:
             _CACHE["ort_available"] = True
             # Get version without full import (read from metadata)
-            try:
-                from importlib.metadata import version
-                _CACHE["ort_version"] = version("onnxruntime")
-            except Exception:
-                _CACHE["ort_version"] = "installed"
+            _CACHE["ort_version"] = _ort_version(spec)
         else:
             _CACHE["ort_available"] = False
             _CACHE["ort_version"] = None
@@ -57,11 +234,24 @@ def _ensure_init():
 
     # GPU detection - only attempt when not forced to CPU
     gpu_detected = False
-    if not force_cpu:
+    from .gpu import has_nvidia_hw
+    if not force_cpu and has_nvidia_hw():
         # Primary: torch.cuda (only works when CUDA torch is installed)
         if _CACHE["torch_available"]:
-            import torch
-            if torch.cuda.is_available():
+            try:
+                import torch
+            except (ImportError, OSError):
+                # Broken install (e.g. missing CUDA DLLs) - treat as absent
+                torch = None
+                _CACHE["torch_available"] = False
+                _CACHE["torch_version"] = None
+                persist = False
+            if torch is not None and not torch.cuda.is_available():
+                # A CPU build is a stable answer; a CUDA build without a
+                # device may just be a busy or resuming driver
+                if getattr(torch.version, "cuda", None):
+                    persist = False
+            elif torch is not None:
                 props = torch.cuda.get_device_properties(0)
                 gpu_name = torch.cuda.get_device_name(0)
                 vram_bytes = props.total_memory
@@ -146,6 +336,7 @@ def _ensure_init():
         }
 
     _CACHE["checked"] = True
+    return persist
 
 def get_gpu_type():
     _ensure_init()
@@ -167,15 +358,15 @@ def get_ort_status():
     _ensure_init()
     return _CACHE["ort_available"], _CACHE["ort_version"]
 
-def refresh_vram():
-    """Force re-detection and return current hardware info."""
+def refresh_vram(config=None, force=False):
+    """Re-check hardware and return current info.
+
+    Detection only re-runs when the cache signature (driver, torch and
+    onnxruntime install state, force_cpu) no longer matches the saved one,
+    unless force is set, which always detects afresh.
+    """
+    global _ORT_VERSION_CACHE
     _CACHE["checked"] = False
-    _ensure_init()
+    _ORT_VERSION_CACHE = None
+    _ensure_init(config, force)
     return _CACHE["hw_info"]
-
-def get_suggested_setup():
-    """Get the suggested setup based on detected hardware."""
-    _ensure_init()
-    if _CACHE["gpu_type"] == "nvidia":
-        return "gpu", f"GPU mode ({_CACHE['gpu_name']})"
-    return "cpu", "CPU-only mode"
@@ -0,0 +1,24 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# AMV Toolkit - Media Probing
+# Lightweight ffprobe helpers shared by the convert and separation paths
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+def probe_duration(path: str) -> float | None:
+    """Return the media duration in seconds via ffprobe, or None if unknown.
+
+    Reads container metadata only, so it costs a fraction of a full decode.
+    """
+    import subprocess
+    try:
+        result = subprocess.run(
+            ["ffprobe", "-v", "error", "-show_entries", "format=duration",
+             "-of", "default=noprint_wrappers=1:nokey=1", path],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, timeout=10
+        )
+        if result.returncode == 0:
+            duration = float(result.stdout.strip())
+            return duration if duration > 0 else None
+    except (OSError, subprocess.TimeoutExpired, ValueError):
+        pass
+    return None
@@ -4,16 +4,37 @@
 
 import sys
 
+# Win32 entry points, resolved once at import instead of on every notification
+_GetConsoleWindow = None
+_FlashWindow = None
+
+if sys.platform == "win32":
+    try:
+        import ctypes
+        from ctypes import wintypes
+
+        _k32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        _u32 = ctypes.WinDLL("user32", use_last_error=True)
+
+        _GetConsoleWindow = _k32.GetConsoleWindow
+        _GetConsoleWindow.argtypes = []
+        _GetConsoleWindow.restype = wintypes.HWND
+
+        _FlashWindow = _u32.FlashWindow
+        _FlashWindow.argtypes = [wintypes.HWND, wintypes.BOOL]
+        _FlashWindow.restype = wintypes.BOOL
+    except (ImportError, OSError, AttributeError):
+        _GetConsoleWindow = _FlashWindow = None
+
 
 def notify_complete(app):
     """Send completion notification - terminal bell + taskbar flash on Windows."""
     app.bell()
 
-    if sys.platform == "win32":
+    if _FlashWindow is not None:
         try:
-            import ctypes
-            hwnd = ctypes.windll.kernel32.GetConsoleWindow()
+            hwnd = _GetConsoleWindow()
             if hwnd:
-                ctypes.windll.user32.FlashWindow(hwnd, True)
-        except Exception:
+                _FlashWindow(hwnd, True)
+        except OSError:
             pass
@@ -0,0 +1,118 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# AMV Toolkit - Scan Cache
+# Persists directory scan results, keyed by the stat of every walked directory
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import os
+import json
+import threading
+
+
+def _user_cache_dir() -> str:
+    """Per-user cache directory: %LOCALAPPDATA%\\amv on Windows, else ~/.cache/amv."""
+    if os.name == 'nt':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'amv')
+
+
+# Scanned paths are per-user, so they live outside the checkout
+SCAN_CACHE_FILE = os.path.join(_user_cache_dir(), "scan_cache.json")
+MAX_ENTRIES = 32
+
+_LOCK = threading.Lock()
+# scanned directory -> {"dirs": {walked dir: signature}, "paths": (...)}
+_ENTRIES: dict | None = None
+
+
+def dir_signature(path: str) -> list | None:
+    """Return [mtime_ns, size] for a directory, or None if it can't be read.
+
+    A directory's mtime changes when entries are added, removed or renamed.
+    Size is included because mtime alone is unreliable on some Windows
+    filesystems.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return stat_signature(st)
+
+
+def stat_signature(st: os.stat_result) -> list:
+    """dir_signature() for a stat result the caller already has."""
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _entries() -> dict:
+    """Return the in-memory cache, loading it from disk on first use."""
+    global _ENTRIES
+    if _ENTRIES is None:
+        try:
+            with open(SCAN_CACHE_FILE, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = None
+        _ENTRIES = data if isinstance(data, dict) else {}
+    return _ENTRIES
+
+
+def _save(entries: dict) -> None:
+    """Write the cache atomically so a crash never leaves half a file."""
+    tmp = f"{SCAN_CACHE_FILE}.tmp"
+    try:
+        os.makedirs(os.path.dirname(SCAN_CACHE_FILE), exist_ok=True)
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(entries, f)
+        os.replace(tmp, SCAN_CACHE_FILE)
+    except (OSError, TypeError, ValueError):
+        pass
+
+
+def _is_fresh(entry) -> bool:
+    """True if every directory the cached scan walked is unchanged."""
+    if not isinstance(entry, dict):
+        return False
+    dirs = entry.get("dirs")
+    if not isinstance(dirs, dict) or not dirs or not isinstance(entry.get("paths"), (list, tuple)):
+        return False
+    return all(dir_signature(path) == sig for path, sig in dirs.items())
+
+
+def get_or_scan(directory: str, scan_fn, cancel=None) -> tuple:
+    """Return scan results for directory, re-scanning only if it changed.
+
+    Results are a tuple so cached entries can be handed out without copying.
+
+    Args:
+        directory: Root directory to scan.
+        scan_fn: Called as scan_fn(directory, walked) on a miss. It must
+            record dir_signature() of each directory it lists into the
+            walked dict before listing it, and return the found paths.
+        cancel: Optional threading.Event; results of a scan that was
+            cancelled are returned but not cached, since they're partial.
+    """
+    key = os.path.abspath(directory)
+    with _LOCK:
+        entry = _entries().get(key)
+    if _is_fresh(entry):
+        paths = entry["paths"]
+        if not isinstance(paths, tuple):  # freshly loaded from JSON
+            paths = entry["paths"] = tuple(paths)
+        return paths
+
+    walked = {}
+    paths = tuple(scan_fn(directory, walked))
+    if cancel is not None and cancel.is_set():
+        return paths
+
+    with _LOCK:
+        entries = _entries()
+        entries.pop(key, None)
+        entries[key] = {"dirs": walked, "paths": paths}
+        # Oldest entries first in insertion order
+        while len(entries) > MAX_ENTRIES:
+            entries.pop(next(iter(entries)))
+        _save(entries)
+    return paths
@@ -4,27 +4,209 @@
 # ═══════════════════════════════════════════════════════════════════════════════
 
 import os
-import subprocess
-import shutil
+import itertools
+import threading
+from collections import deque
 from textual.app import ComposeResult
 from textual.widgets import Footer, Static, Label, Button, Input
 from textual.containers import Vertical, Center
 from textual import work
 
 from textual.screen import Screen
-from amv.widgets.menu import StyledOptionList, create_menu_option
-from amv.config import add_recent_file
+from amv.widgets.menu import StyledOptionList, create_menu_option, create_separator
+from amv.config import add_recent_file, get_original_dir
+from amv.scan_cache import get_or_scan, stat_signature
 from amv.notify import notify_complete
+from amv.media import probe_duration
 
-VIDEO_EXTENSIONS = {'mp4', 'mkv', 'avi', 'webm', 'mov'}
-AUDIO_EXTENSIONS = {'wav', 'mp3', 'flac', 'm4a', 'ogg', 'aac', 'opus', 'wma'}
+VIDEO_EXTENSIONS = frozenset({'mp4', 'mkv', 'avi', 'webm', 'mov'})
+AUDIO_EXTENSIONS = frozenset({'wav', 'mp3', 'flac', 'm4a', 'ogg', 'aac', 'opus', 'wma'})
 MEDIA_EXTENSIONS = VIDEO_EXTENSIONS | AUDIO_EXTENSIONS
 
+# Dotted forms, so scans compare splitext() output directly
+VIDEO_SUFFIXES = frozenset(f'.{ext}' for ext in VIDEO_EXTENSIONS)
+MEDIA_SUFFIXES = frozenset(f'.{ext}' for ext in MEDIA_EXTENSIONS)
+MEDIA_SUFFIX_TUPLE = tuple(sorted(MEDIA_SUFFIXES))  # for str.endswith
+
+# Max files a scan collects, and how many of them the suggestion list shows
+SCAN_LIMIT = 200
+LIST_LIMIT = 20
+
 # Directories to skip during deep scan
-SKIP_DIRS = {
+SKIP_DIRS = frozenset({
     '.git', 'node_modules', '.venv', '__pycache__', 'venv', 'env', '.tox',
     '$Recycle.Bin', 'System Volume Information', 'AppData', '.cache', '.local',
-}
+})
+
+_FFMPEG_PATH: str | None = None
+
+
+def _ffmpeg_path() -> str | None:
+    """Return the ffmpeg executable, caching it once found.
+
+    A miss isn't cached, so installing ffmpeg mid-session still works.
+    """
+    global _FFMPEG_PATH
+    if _FFMPEG_PATH is None:
+        import shutil
+        _FFMPEG_PATH = shutil.which("ffmpeg")
+    return _FFMPEG_PATH
+
+
+def _wav_output_path(input_file: str) -> str:
+    """Return the WAV path _convert_to_wav writes for input_file."""
+    input_stem, input_ext = os.path.splitext(input_file)
+    # If already .wav, append _converted to avoid overwriting the source
+    if input_ext.lower() == '.wav':
+        return f"{input_stem}_converted.wav"
+    return f"{input_stem}.wav"
+
+
+def _plan_batch(files) -> tuple[list, list]:
+    """Split a batch into (files safe to convert together, skipped files).
+
+    Jobs run concurrently, so two of them must never write the same WAV
+    (clip.mp4 and clip.mkv both make clip.wav), and no job may read a file
+    another job is writing (clip.wav is clip.mkv's output). The first file
+    claiming an output keeps it; inputs that are another job's output are
+    skipped.
+    """
+    def key(path):
+        return os.path.normcase(os.path.abspath(path))
+
+    jobs = {}  # output key -> input
+    skipped = []
+    for f in files:
+        out = key(_wav_output_path(f))
+        if out in jobs:
+            skipped.append(f)
+        else:
+            jobs[out] = f
+    planned = []
+    for f in jobs.values():
+        (skipped if key(f) in jobs else planned).append(f)
+    return planned, skipped
+
+
+def _convert_to_wav(input_file: str, threads: str = "0", on_progress=None) -> tuple[bool, str]:
+    """Convert input_file to a WAV next to it with ffmpeg.
+
+    Args:
+        input_file: Source media file.
+        threads: Value for ffmpeg's -threads ("0" lets ffmpeg decide).
+        on_progress: Optional callable taking a 0-99 percentage.
+
+    Returns:
+        (True, output path) on success, (False, error message) otherwise.
+    """
+    import subprocess
+
+    output_file = _wav_output_path(input_file)
+
+    try:
+        # -progress writes key=value lines to stdout; -nostats keeps the
+        # human-readable stats out of the error log
+        # -nostdin stops ffmpeg from reading keys off the TUI's terminal
+        cmd = [
+            _ffmpeg_path() or "ffmpeg",
+            "-nostdin",
+            "-progress", "pipe:1", "-nostats",
+            "-threads", threads,
+            "-i", input_file,
+            # Only decode the first audio track; skip video/subs/data
+            "-map", "0:a:0",
+            "-vn", "-sn", "-dn",
+            "-acodec", "pcm_s16le",
+            "-ar", "44100",
+            "-ac", "2",
+            "-y",
+            output_file
+        ]
+
+        duration = probe_duration(input_file) if on_progress else None
+        if on_progress and not duration:
+            # Unknown length, so no real progress to show
+            on_progress(50)
+
+        # stderr is merged so a chatty ffmpeg can't fill an unread pipe.
+        # Output stays as bytes; only the error tail ever gets decoded.
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=1024 * 1024
+        )
+        # Only the tail is shown on failure, so don't keep the rest
+        log_lines = deque(maxlen=20)
+        last_pct = -1
+        for line in proc.stdout:
+            key, sep, value = line.partition(b"=")
+            if not (sep and key.replace(b"_", b"").isalnum()):
+                log_lines.append(line)
+            # Despite the name, out_time_ms is in microseconds
+            elif key == b"out_time_ms" and duration:
+                try:
+                    pct = min(99, int(int(value) / 1_000_000 / duration * 100))
+                except ValueError:
+                    continue
+                if pct != last_pct:
+                    last_pct = pct
+                    on_progress(pct)
+        proc.wait()
+
+        if proc.returncode == 0 and os.path.exists(output_file):
+            return True, output_file
+        error_msg = b"".join(log_lines)[-200:].decode("utf-8", "replace") or "Unknown error"
+        return False, f"Conversion failed: {error_msg}"
+
+    except Exception as e:
+        return False, str(e)
+
+
+def _iter_media_files(directory: str, walked: dict | None = None,
+                      cancel: threading.Event | None = None):
+    """Yield media file paths under directory, walking it depth-first.
+
+    See ConvertScreen._deep_scan for walked and cancel.
+    """
+    stack = [directory]
+    seen = set()
+    while stack:
+        if cancel is not None and cancel.is_set():
+            return
+        current = stack.pop()
+        try:
+            st = os.stat(current)
+        except OSError:
+            if walked is not None:
+                walked[current] = None
+            continue
+        # Junctions and bind mounts can reach the same folder twice, or
+        # loop; st_ino is 0 on filesystems that don't report one
+        if st.st_ino:
+            ident = (st.st_dev, st.st_ino)
+            if ident in seen:
+                continue
+            seen.add(ident)
+        if walked is not None:
+            walked[current] = stat_signature(st)
+        try:
+            it = os.scandir(current)
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                name = entry.name
+                try:
+                    # DirEntry caches d_type, so this needs no extra stat
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    continue
+                if is_dir:
+                    if name not in SKIP_DIRS and not name.startswith('.'):
+                        stack.append(entry.path)
+                elif name.lower().endswith(MEDIA_SUFFIX_TUPLE):
+                    yield entry.path
 
 
 class ConvertScreen(Screen):
@@ -36,11 +218,24 @@ class ConvertScreen(Screen):
         ("left", "go_back"),
     ]
 
+    # Markup for every whole percentage of the 30-cell progress bar
+    _BARS = tuple(
+        f"[#50fa7b]{'█' * (30 * p // 100)}[/#50fa7b][#44475a]{'░' * (30 - 30 * p // 100)}[/#44475a]"
+        for p in range(101)
+    )
+
     def __init__(self):
         super().__init__()
         self.selected_file = None
         self.is_converting = False
         self._scan_timer = None
+        self._scan_cancel = threading.Event()
+        self._listed_files = []
+        # Unfiltered results of the latest scan per directory, and what the
+        # suggestion list currently shows
+        self._scans = {}
+        self._shown = None
+        self._last_pct = -1
 
     def compose(self) -> ComposeResult:
         with Vertical():
@@ -69,7 +264,7 @@ class ConvertScreen(Screen):
 
     def on_mount(self) -> None:
         self.query_one("#path-input", Input).focus()
-        original_dir = os.environ.get('AMV_ORIGINAL_DIR', os.getcwd())
+        original_dir = get_original_dir()
         self._run_scan(original_dir, "")
 
     # ─── File Selection ──────────────────────────────────────────────────────
@@ -79,6 +274,8 @@ class ConvertScreen(Screen):
         if option_id.startswith("file:"):
             file_path = option_id[5:]
             self._start_conversion(file_path)
+        elif option_id == "convert_all":
+            self._start_batch(list(self._listed_files))
 
     def on_input_changed(self, event: Input.Changed) -> None:
         if event.input.id != "path-input":
@@ -97,7 +294,7 @@ class ConvertScreen(Screen):
     def _parse_and_scan(self, text: str) -> None:
         """Parse input text into directory + filter, then launch a scan."""
         text = text.strip().strip('"\'')
-        original_dir = os.environ.get('AMV_ORIGINAL_DIR', os.getcwd())
+        original_dir = get_original_dir()
 
         if not text:
             self._run_scan(original_dir, "")
@@ -112,40 +309,66 @@ class ConvertScreen(Screen):
                 self._run_scan(original_dir, text.lower())
 
     def _run_scan(self, directory: str, name_filter: str) -> None:
-        """Show scanning indicator and launch background scan."""
-        self.query_one("#path-scan-info", Static).update(
-            f"[dim]📁 {directory}  (scanning...)[/dim]"
-        )
+        """Show the last known results (or a scanning indicator) and launch a background scan."""
+        known = self._scans.get(directory)
+        if known is not None:
+            # The worker below replaces these if anything changed on disk
+            self._show_scan_results(directory, self._filter_results(known, name_filter))
+        else:
+            self.query_one("#path-scan-info", Static).update(
+                f"[dim]📁 {directory}  (scanning...)[/dim]"
+            )
+        # exclusive=True only cancels the worker object; the filesystem walk
+        # itself has to be told to stop
+        self._scan_cancel.set()
+        cancel = self._scan_cancel = threading.Event()
         self.run_worker(
-            lambda: self._scan_worker(directory, name_filter),
+            lambda: self._scan_worker(directory, name_filter, cancel),
             thread=True, exclusive=True, group="path_scan",
         )
 
-    def _scan_worker(self, directory: str, name_filter: str) -> None:
+    def _scan_worker(self, directory: str, name_filter: str, cancel: threading.Event) -> None:
         """Run deep scan in background thread, then update UI."""
-        results = self._deep_scan(directory)
-        if name_filter:
-            results = [f for f in results if name_filter in os.path.basename(f).lower()]
-        self.app.call_from_thread(self._show_scan_results, directory, results)
-
-    def _deep_scan(self, directory: str) -> list:
-        """Recursively scan for all media files (video + audio)."""
-        results = []
+        results = get_or_scan(
+            directory, lambda d, walked: self._deep_scan(d, walked, cancel), cancel
+        )
+        if cancel.is_set():
+            return
+        self._scans[directory] = results
+        self.app.call_from_thread(
+            self._show_scan_results, directory, self._filter_results(results, name_filter)
+        )
+
+    @staticmethod
+    def _filter_results(results, name_filter: str):
+        if not name_filter:
+            return results
+        return [f for f in results if name_filter in os.path.basename(f).lower()]
+
+    def _deep_scan(self, directory: str, walked: dict | None = None,
+                   cancel: threading.Event | None = None) -> list:
+        """Recursively scan for all media files (video + audio), up to SCAN_LIMIT.
+
+        If walked is given, each directory's signature is recorded into it
+        before the directory is listed, for the scan cache. Setting cancel
+        stops the walk at the next directory.
+        """
+        files = _iter_media_files(directory, walked, cancel)
         try:
-            for root, dirs, files in os.walk(directory):
-                dirs[:] = [d for d in dirs if d not in SKIP_DIRS and not d.startswith('.')]
-                for f in files:
-                    ext = os.path.splitext(f)[1].lower().lstrip('.')
-                    if ext in MEDIA_EXTENSIONS:
-                        results.append(os.path.join(root, f))
-                        if len(results) >= 200:
-                            return results
-        except OSError:
-            pass
+            # Pulling lazily means the walk stops as soon as the cap is hit
+            results = list(itertools.islice(files, SCAN_LIMIT))
+        finally:
+            files.close()
+        if cancel is not None and cancel.is_set():
+            return []
         return results
 
     def _show_scan_results(self, directory: str, results: list) -> None:
         """Update the suggestion list with scan results."""
+        if self._shown == (directory, list(results)):
+            return  # Refresh found nothing new; keep the highlight where it is
+        self._shown = (directory, list(results))
+
         self.query_one("#path-scan-info", Static).update(
             f"[dim]📁 {directory}  ({len(results)} files found)[/dim]"
         )
@@ -153,11 +376,18 @@ class ConvertScreen(Screen):
         menu = self.query_one("#path-suggestions", StyledOptionList)
         menu.clear_options()
 
-        for path in results[:20]:
-            name = os.path.basename(path)
-            parent = os.path.basename(os.path.dirname(path))
-            ext = os.path.splitext(name)[1].lower().lstrip('.')
-            emoji = "🎬" if ext in VIDEO_EXTENSIONS else "🎵"
+        self._listed_files = results[:LIST_LIMIT]
+        if len(self._listed_files) > 1:
+            menu.add_option(create_menu_option(
+                "📦", f"Convert all {len(self._listed_files)} listed files", "", "convert", "convert_all"
+            ))
+            menu.add_option(create_separator())
+
+        for path in self._listed_files:
+            parent_dir, name = os.path.split(path)
+            parent = os.path.basename(parent_dir)
+            dot = name.rfind('.')
+            emoji = "🎬" if dot > 0 and name[dot:].lower() in VIDEO_SUFFIXES else "🎵"
             menu.add_option(create_menu_option(emoji, name, f"({parent})", "media", f"file:{path}"))
 
     # ─── Conversion ───────────────────────────────────────────────────────────
@@ -177,59 +407,88 @@ class ConvertScreen(Screen):
 
         self._conversion_worker(file_path)
 
+    def _start_batch(self, files: list) -> None:
+        self.selected_file = None
+        self.is_converting = True
+
+        self.query_one("#path-section").add_class("hidden")
+        self.query_one("#progress-section").remove_class("hidden")
+
+        self._render_progress_bar(0)
+
+        self.query_one("#progress-label", Label).update(f"🔄 Converting {len(files)} files to WAV...")
+        self.query_one("#progress-file", Static).update(f"[cyan]📁 {os.path.dirname(files[0])}[/cyan]")
+        self.query_one("#progress-status", Static).update(f"[dim]0/{len(files)} files done[/dim]")
+
+        self._batch_worker(files)
+
     def _render_progress_bar(self, percent: int) -> None:
-        bar_width = 30
-        filled = int(bar_width * percent / 100)
-        empty = bar_width - filled
-        bar = f"[#50fa7b]{'█' * filled}[/#50fa7b][#44475a]{'░' * empty}[/#44475a]"
-        self.query_one("#progress-bar", Static).update(bar)
+        percent = max(0, min(100, int(percent)))
+        if percent == self._last_pct:
+            return
+        self._last_pct = percent
+        self.query_one("#progress-bar", Static).update(self._BARS[percent])
 
     @work(thread=True, exclusive=True)
     def _conversion_worker(self, input_file: str) -> None:
-        input_dir = os.path.dirname(input_file)
-        input_name = os.path.basename(input_file)
-        input_stem, input_ext = os.path.splitext(input_name)
+        if not _ffmpeg_path():
+            self.app.call_from_thread(self._show_error, "ffmpeg not found! Please install ffmpeg.")
+            return
 
-        # If already .wav, append _converted to avoid overwriting the source
-        if input_ext.lower() == '.wav':
-            output_file = os.path.join(input_dir, f"{input_stem}_converted.wav")
+        ok, result = _convert_to_wav(
+            input_file,
+            on_progress=lambda pct: self.app.call_from_thread(self._render_progress_bar, pct),
+        )
+        if ok:
+            add_recent_file(input_file)
+            self.app.call_from_thread(self._show_success, f"Saved: {os.path.basename(result)}")
         else:
-            output_file = os.path.join(input_dir, f"{input_stem}.wav")
+            self.app.call_from_thread(self._show_error, result)
 
-        ffmpeg_path = shutil.which("ffmpeg")
-        if not ffmpeg_path:
+    @work(thread=True, exclusive=True)
+    def _batch_worker(self, files: list) -> None:
+        """Convert several files at once on a small thread pool."""
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+        if not _ffmpeg_path():
             self.app.call_from_thread(self._show_error, "ffmpeg not found! Please install ffmpeg.")
             return
 
-        try:
-            cmd = [
-                "ffmpeg",
-                "-i", input_file,
-                "-vn",
-                "-acodec", "pcm_s16le",
-                "-ar", "44100",
-                "-ac", "2",
-                "-y",
-                output_file
-            ]
-
-            self.app.call_from_thread(self._render_progress_bar, 50)
-
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True
+        files, skipped = _plan_batch(files)
+        total = len(files)
+        # Each job gets 2 ffmpeg threads, so keep the pool small enough
+        # not to oversubscribe the CPU
+        workers = max(1, (os.cpu_count() or 1) // 4)
+        done = 0
+        failed = []
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(_convert_to_wav, f, "2"): f for f in files}
+            for future in as_completed(futures):
+                input_file = futures[future]
+                ok, _ = future.result()
+                if ok:
+                    add_recent_file(input_file)
+                else:
+                    failed.append(os.path.basename(input_file))
+                done += 1
+                self.app.call_from_thread(self._render_progress_bar, done * 100 // total)
+                self.app.call_from_thread(
+                    self._set_status, f"[dim]{done}/{total} files done[/dim]"
+                )
+
+        note = (
+            f" ({len(skipped)} skipped: their WAV would clash with another file's)"
+            if skipped else ""
+        )
+        if failed:
+            shown = ", ".join(failed[:3]) + (", ..." if len(failed) > 3 else "")
+            self.app.call_from_thread(
+                self._show_error, f"{len(failed)} of {total} conversions failed: {shown}{note}"
             )
+        else:
+            self.app.call_from_thread(self._show_success, f"Converted {total} files{note}")
 
-            if result.returncode == 0 and os.path.exists(output_file):
-                add_recent_file(input_file)
-                self.app.call_from_thread(self._show_success, f"Saved: {os.path.basename(output_file)}")
-            else:
-                error_msg = result.stderr[-200:] if result.stderr else "Unknown error"
-                self.app.call_from_thread(self._show_error, f"Conversion failed: {error_msg}")
-
-        except Exception as e:
-            self.app.call_from_thread(self._show_error, str(e))
+    def _set_status(self, message: str) -> None:
+        self.query_one("#progress-status", Static).update(message)
 
     def _show_success(self, message: str) -> None:
         self.is_converting = False
@@ -259,7 +518,7 @@ class ConvertScreen(Screen):
         inp = self.query_one("#path-input", Input)
         inp.value = ""
         inp.focus()
-        original_dir = os.environ.get('AMV_ORIGINAL_DIR', os.getcwd())
+        original_dir = get_original_dir()
         self._run_scan(original_dir, "")
 
     def action_go_back(self) -> None:
@@ -3,16 +3,32 @@
 # Home menu with navigation to all features
 # ═══════════════════════════════════════════════════════════════════════════════
 
-import os
-import sys
 from textual.app import ComposeResult
 from textual.widgets import Footer, Static
 from textual.containers import Vertical, Center
 
 from textual.screen import Screen
 from amv.widgets.banner import Banner
+from amv.config import get_original_dir
 from amv.widgets.menu import StyledOptionList, create_menu_option, create_separator
 
+# Static menu, built once at import rather than on every compose
+_MAIN_OPTIONS = (
+    create_menu_option("📺", "Download from YouTube", "Video or Audio", "video", "youtube"),
+    create_menu_option("🎚️", "Extract Vocals", "AI separation", "audio", "vocals"),
+    create_menu_option("🔄", "Convert to WAV", "Extract audio from any file", "convert", "convert"),
+    create_separator(),
+    create_menu_option("🔧", "System Check", "Verify installation", "settings", "setup"),
+    create_menu_option("⚙️", "Settings", "", "settings", "settings"),
+    create_menu_option("🚪", "Exit", "", "back", "exit"),
+)
+
+
+def _prime_setup_cache() -> None:
+    """Pre-collect System Check results so the setup screen opens instantly."""
+    from amv.screens.setup import prime_setup_cache
+    prime_setup_cache()
+
 
 class MainScreen(Screen):
     """Main menu screen with navigation options."""
@@ -22,25 +38,28 @@ class MainScreen(Screen):
         ("escape", "quit", "Quit"),
     ]
 
+    # Menu option id -> installed screen name ("exit" quits instead)
+    _SCREENS = {
+        "youtube": "youtube",
+        "vocals": "vocals",
+        "convert": "convert",
+        "setup": "setup",
+        "settings": "settings",
+        "exit": "exit",
+    }
+
+    _prime_worker = None  # Background System Check priming, if started
+
     def compose(self) -> ComposeResult:
-        # Get the working directory
-        original_dir = os.environ.get('AMV_ORIGINAL_DIR', os.getcwd())
+        # Resolved once per process by config, so no getcwd() per compose
+        original_dir = get_original_dir()
         
         with Vertical():
             yield Banner()
             yield Static(f"[dim]📁 {original_dir}[/dim]", id="cwd-display")
             
             with Center():
-                yield StyledOptionList(
-                    create_menu_option("📺", "Download from YouTube", "Video or Audio", "video", "youtube"),
-                    create_menu_option("🎚️", "Extract Vocals", "AI separation", "audio", "vocals"),
-                    create_menu_option("🔄", "Convert to WAV", "Extract audio from any file", "convert", "convert"),
-                    create_separator(),
-                    create_menu_option("🔧", "System Check", "Verify installation", "settings", "setup"),
-                    create_menu_option("⚙️", "Settings", "", "settings", "settings"),
-                    create_menu_option("🚪", "Exit", "", "back", "exit"),
-                    id="main-menu"
-                )
+                yield StyledOptionList(*_MAIN_OPTIONS, id="main-menu")
         
         yield Footer()
     
@@ -48,22 +67,20 @@ class MainScreen(Screen):
         """Focus the menu on mount."""
         self.query_one("#main-menu").focus()
     
+    def on_option_list_option_highlighted(self, event) -> None:
+        """Start the System Check probes once the user moves onto that entry."""
+        if event.option_id != "setup":
+            return
+        if self._prime_worker is None or self._prime_worker.is_finished:
+            self._prime_worker = self.run_worker(_prime_setup_cache, thread=True)
+
     def on_option_list_option_selected(self, event) -> None:
         """Handle menu selection."""
-        option_id = event.option_id
-        
-        if option_id == "youtube":
-            self.app.push_screen("youtube")
-        elif option_id == "vocals":
-            self.app.push_screen("vocals")
-        elif option_id == "convert":
-            self.app.push_screen("convert")
-        elif option_id == "setup":
-            self.app.push_screen("setup")
-        elif option_id == "settings":
-            self.app.push_screen("settings")
-        elif option_id == "exit":
+        screen = self._SCREENS.get(event.option_id)
+        if screen == "exit":
             self.app.exit()
+        elif screen:
+            self.app.push_screen(screen)
     
     def action_quit(self) -> None:
         """Quit the application."""
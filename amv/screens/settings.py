@@ -4,6 +4,7 @@
 # ═══════════════════════════════════════════════════════════════════════════════
 
 import os
+import functools
 import subprocess
 from textual.app import ComposeResult
 from textual.widgets import Footer, Static, DataTable
@@ -11,7 +12,7 @@ from textual.containers import Vertical, Center
 
 from textual.screen import Screen
 from amv.widgets.menu import StyledOptionList, create_menu_option, create_separator
-from amv.config import MODELS_DIR, get_output_dirs, ensure_output_dirs, load_config
+from amv.config import MODELS_DIR, get_output_dirs, ensure_output_dirs
 from amv.hardware import get_hw_info, get_torch_status
 from amv.gpu import check_nvidia_gpu, verify_cuda_torch
 
@@ -24,6 +25,37 @@ def get_effective_mode() -> str:
     return "gpu" if verify_cuda_torch() else "cpu"
 
 
+# Neither changes within a session unless a mode switch installs something,
+# so re-entering Settings shouldn't re-probe torch or fork nvidia-smi
+@functools.lru_cache(maxsize=1)
+def _cached_mode() -> str:
+    return get_effective_mode()
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_gpu_name() -> str | None:
+    return check_nvidia_gpu()
+
+
+def invalidate_cache() -> None:
+    """Forget cached mode/GPU info after dependencies change."""
+    _cached_mode.cache_clear()
+    _cached_gpu_name.cache_clear()
+
+
+# Static parts of the menu around the mode-dependent switch entry
+_MENU_PREFIX = (
+    create_menu_option("📂", "Open amv-script folder", "", "folder", "open_base"),
+    create_menu_option("📂", "Open models folder", "", "folder", "open_models"),
+    create_menu_option("🔍", "Check dependencies", "", "settings", "deps"),
+    create_separator(),
+)
+_MENU_SUFFIX = (
+    create_separator(),
+    create_menu_option("⬅️", "Back to Main Menu", "", "back", "back"),
+)
+
+
 class SettingsScreen(Screen):
     """Settings screen with configuration display, folder access, and mode switching."""
 
@@ -40,7 +72,7 @@ class SettingsScreen(Screen):
             yield Static("")  # Spacer
 
             # Configuration table
-            yield DataTable(id="config-table", zebra_stripes=True)
+            yield DataTable(id="config-table", zebra_stripes=False)
 
             yield Static("")  # Spacer
 
@@ -50,95 +82,141 @@ class SettingsScreen(Screen):
 
         yield Footer()
 
+    # Row key -> value currently shown; empty until the rows are added
+    _row_values: dict[str, str] = {}
+    # Mode the switch entry currently offers; None until the menu is built
+    _switch_target: str | None = None
+
     def on_mount(self) -> None:
         """Initialize settings display."""
+        table = self.query_one("#config-table", DataTable)
+        table.add_column("Setting", key="setting")
+        table.add_column("Value", key="value")
         self._populate_config_table()
         self._populate_menu()
         self.query_one("#settings-menu").focus()
+        self.call_after_refresh(self._preload_setup)
 
-    def _populate_config_table(self) -> None:
-        """Populate the configuration table."""
-        table = self.query_one("#config-table", DataTable)
-        table.clear(columns=True)
+    def _preload_setup(self) -> None:
+        """Import the setup screen off the UI thread so switching is instant."""
+        def _import() -> None:
+            import amv.screens.setup  # noqa: F401
 
-        table.add_column("Setting", key="setting")
-        table.add_column("Value", key="value")
+        self.run_worker(_import, thread=True)
 
+    def on_screen_resume(self) -> None:
+        """Refresh the table and switch entry when returning, e.g. after a mode switch."""
+        self._populate_config_table()
+        self._populate_menu()
+
+    def _populate_config_table(self) -> None:
+        """Populate the configuration table, rewriting only changed cells."""
         dirs = get_output_dirs()
         hw_info = get_hw_info()
-        current_mode = get_effective_mode().upper()
-
-        table.add_row("[cyan]Output Folder[/cyan]", dirs["base"])
-        table.add_row("[cyan]Models Folder[/cyan]", MODELS_DIR)
-        table.add_row("[cyan]Device[/cyan]", hw_info["device"])
-        table.add_row("[cyan]Provider[/cyan]", hw_info["provider"])
-        table.add_row("[cyan]Mode[/cyan]", f"[bold]{current_mode}[/bold]")
-
-    def _populate_menu(self) -> None:
-        """Build the menu with mode-aware switch option."""
-        menu = self.query_one("#settings-menu", StyledOptionList)
-        menu.clear_options()
-
-        current_mode = get_effective_mode()
-        gpu_name = check_nvidia_gpu()
+        current_mode = _cached_mode().upper()
 
-        options = [
-            create_menu_option("📂", "Open amv-script folder", "", "folder", "open_base"),
-            create_menu_option("📂", "Open models folder", "", "folder", "open_models"),
-            create_menu_option("🔍", "Check dependencies", "", "settings", "deps"),
-            create_separator(),
-        ]
+        rows = {
+            "output": ("[cyan]Output Folder[/cyan]", dirs["base"]),
+            "models": ("[cyan]Models Folder[/cyan]", MODELS_DIR),
+            "device": ("[cyan]Device[/cyan]", hw_info["device"]),
+            "provider": ("[cyan]Provider[/cyan]", hw_info["provider"]),
+            "mode": ("[cyan]Mode[/cyan]", f"[bold]{current_mode}[/bold]"),
+        }
 
-        # Dynamic switch button based on current mode
-        if current_mode == "cpu":
+        table = self.query_one("#config-table", DataTable)
+        # One refresh for the whole populate rather than one per row
+        with self.app.batch_update():
+            if not self._row_values:
+                for key, (label, value) in rows.items():
+                    table.add_row(label, value, key=key)
+            else:
+                for key, (_, value) in rows.items():
+                    if self._row_values[key] != value:
+                        table.update_cell(key, "value", value)
+        self._row_values = {key: value for key, (_, value) in rows.items()}
+
+    def _switch_option(self):
+        """Return (target mode, option) for the mode-dependent switch entry."""
+        if _cached_mode() == "cpu":
+            gpu_name = _cached_gpu_name()
             if gpu_name:
                 label = f"Switch to GPU ({gpu_name})"
             else:
                 label = "Switch to GPU (RTX 50 series)"
-            options.append(create_menu_option(
+            return "gpu", create_menu_option(
                 "🚀", label,
                 "Install CUDA 12.8 PyTorch + BS-Roformer",
-                "settings", "switch_gpu"
-            ))
-        else:
-            options.append(create_menu_option(
-                "💻", "Switch to CPU",
-                "Install CPU PyTorch + Kim Vocal 2 ONNX",
-                "settings", "switch_cpu"
-            ))
+                "settings", "switch_mode"
+            )
+        return "cpu", create_menu_option(
+            "💻", "Switch to CPU",
+            "Install CPU PyTorch + Kim Vocal 2 ONNX",
+            "settings", "switch_mode"
+        )
+
+    def _populate_menu(self) -> None:
+        """Build the menu, or just swap the switch entry if it's already built."""
+        menu = self.query_one("#settings-menu", StyledOptionList)
+        target, option = self._switch_option()
 
-        options.append(create_separator())
-        options.append(create_menu_option("⬅️", "Back to Main Menu", "", "back", "back"))
+        if self._switch_target is None:
+            menu.add_options([*_MENU_PREFIX, option, *_MENU_SUFFIX])
+        elif target != self._switch_target:
+            menu.replace_option_prompt("switch_mode", option.prompt)
+        self._switch_target = target
 
-        menu.add_options(options)
+    def _handle_open_base(self) -> None:
+        dirs = get_output_dirs()
+        # A single stat when the folder exists; only create it if missing
+        if not os.path.isdir(dirs["base"]):
+            ensure_output_dirs()
+        self._open_folder(dirs["base"])
+
+    def _handle_open_models(self) -> None:
+        # Created lazily, so it may not exist before the first separation
+        if not os.path.isdir(MODELS_DIR):
+            os.makedirs(MODELS_DIR, exist_ok=True)
+        self._open_folder(MODELS_DIR)
+
+    def _handle_deps(self) -> None:
+        self.app.push_screen("setup")
+
+    def _handle_switch_mode(self) -> None:
+        from amv.screens.setup import SetupScreen
+        invalidate_cache()
+        self.app.push_screen(SetupScreen(target_mode=self._switch_target))
+
+    def _handle_back(self) -> None:
+        self.action_go_back()
+
+    # Menu option id -> handler, looked up once per selection
+    _HANDLERS = {
+        "open_base": _handle_open_base,
+        "open_models": _handle_open_models,
+        "deps": _handle_deps,
+        "switch_mode": _handle_switch_mode,
+        "back": _handle_back,
+    }
 
     def on_option_list_option_selected(self, event) -> None:
         """Handle menu selection."""
-        option_id = event.option_id
-
-        if option_id == "open_base":
-            dirs = ensure_output_dirs()
-            self._open_folder(dirs["base"])
-        elif option_id == "open_models":
-            if os.path.exists(MODELS_DIR):
-                self._open_folder(MODELS_DIR)
-        elif option_id == "deps":
-            self.app.push_screen("setup")
-        elif option_id == "switch_gpu":
-            from amv.screens.setup import SetupScreen
-            self.app.push_screen(SetupScreen(target_mode="gpu"))
-        elif option_id == "switch_cpu":
-            from amv.screens.setup import SetupScreen
-            self.app.push_screen(SetupScreen(target_mode="cpu"))
-        elif option_id == "back":
-            self.action_go_back()
+        handler = self._HANDLERS.get(event.option_id)
+        if handler is not None:
+            handler(self)
 
     def _open_folder(self, path: str) -> None:
         """Open folder in file explorer."""
         if os.name == 'nt':
-            os.startfile(path)
+            os.startfile(path)  # Already non-blocking
         else:
-            subprocess.run(['xdg-open', path])
+            # Fire-and-forget so the UI doesn't wait for the file manager
+            subprocess.Popen(
+                ['xdg-open', path],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
+            )
 
     def action_go_back(self) -> None:
         """Go back to main menu."""
@@ -4,13 +4,26 @@
 # ═══════════════════════════════════════════════════════════════════════════════
 
 import os
+import re
+import json
 import sys
+import time
+import shlex
+import shutil
+import threading
 import subprocess
+import queue
+import atexit
 import logging
+import logging.handlers
+from collections import deque
+from concurrent.futures import Future
 from datetime import datetime
+from rich.markup import escape
 from textual.app import ComposeResult
 from textual.widgets import Footer, Static, DataTable, Button, Label
 from textual.containers import Vertical, Horizontal, Center
+from textual.coordinate import Coordinate
 from textual.worker import get_current_worker
 
 from textual.screen import Screen
@@ -25,8 +38,17 @@ from amv.gpu import (
 
 LOG_DIR = os.path.join(SCRIPT_DIR, "logs")
 
-def _get_logger() -> logging.Logger:
-    """Get or create the setup logger that writes to logs/setup_YYYY-MM-DD.log."""
+# Seconds a single install step may run before it is killed
+INSTALL_TIMEOUT = 600
+# Installer output shown at most this often; pip can print thousands of lines
+INSTALL_UI_INTERVAL = 0.1
+
+_LOGGER: logging.Logger | None = None
+_LOGGER_LOCK = threading.Lock()
+
+
+def _build_logger() -> logging.Logger:
+    """Create the setup logger that writes to logs/setup_YYYY-MM-DD.log."""
     os.makedirs(LOG_DIR, exist_ok=True)
     logger = logging.getLogger("amv.setup")
     if not logger.handlers:
@@ -37,18 +59,110 @@ def _get_logger() -> logging.Logger:
         fh.setFormatter(logging.Formatter(
             "%(asctime)s [%(levelname)s] %(message)s", datefmt="%H:%M:%S"
         ))
-        logger.addHandler(fh)
+        # Callers only enqueue records; a listener thread does the file writes
+        log_queue = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(log_queue, fh)
+        listener.start()
+        atexit.register(listener.stop)  # Flushes whatever is still queued
+        logger._amv_listener = listener  # Keep it alive with the logger
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
         logger.setLevel(logging.DEBUG)
     return logger
 
 
+def _get_logger() -> logging.Logger:
+    """Return the setup logger, building it on first use.
+
+    Later calls skip the makedirs/getLogger round trip entirely. The log
+    file is dated once per process, so a session that runs past midnight
+    keeps writing to the day it started on.
+    """
+    global _LOGGER
+    if _LOGGER is None:
+        with _LOGGER_LOCK:  # Probes run on worker threads
+            if _LOGGER is None:
+                _LOGGER = _build_logger()
+    return _LOGGER
+
+
 def _fmt_cmd(cmd) -> str:
-    """Format a command (list or string) for display."""
-    if isinstance(cmd, list):
-        return " ".join(cmd)
+    """Format a command (arg sequence or string) for display.
+
+    Arg sequences are quoted with shlex.join so paths with spaces read
+    unambiguously; the sequence itself is what gets executed.
+    """
+    if isinstance(cmd, (list, tuple)):
+        return shlex.join(cmd)
     return cmd
 
 
+# Anything after the bare project name: extras, version specifiers, markers
+_REQ_SUFFIX = re.compile(r"[\[\s<>=!~;@].*$")
+
+
+def _dist_name(requirement: str) -> str:
+    """Return the PEP 503 normalized distribution name of a requirement.
+
+    'Audio_Separator[gpu]>=0.30' -> 'audio-separator'
+    """
+    name = _REQ_SUFFIX.sub("", requirement.strip())
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+# pip install options that consume the following argument
+_PIP_VALUE_OPTS = frozenset({"-i", "--index-url", "--extra-index-url", "-f", "--find-links"})
+
+
+def _split_pip_install(cmd) -> tuple[str, list[str], tuple[str, ...]] | None:
+    """Split '<python> -m pip install ...' into (python, packages, options).
+
+    Returns None for anything else (uninstalls, other tools, plain strings).
+    """
+    if not isinstance(cmd, (list, tuple)) or tuple(cmd[1:4]) != ("-m", "pip", "install"):
+        return None
+    pkgs, opts = [], []
+    args = iter(cmd[4:])
+    for arg in args:
+        if arg in _PIP_VALUE_OPTS:
+            opts += [arg, next(args, "")]
+        elif arg.startswith("-"):
+            opts.append(arg)
+        else:
+            pkgs.append(arg)
+    return cmd[0], pkgs, tuple(opts)
+
+
+def _plan_installs(installs: list, uv: str | None = None) -> list:
+    """Merge pip installs that share the same options so the resolver runs once.
+
+    Only installs between two non-install commands (e.g. the uninstall step of a
+    mode switch) are merged, so ordering around those is kept. If uv is given,
+    merged installs run as 'uv pip install --python <interpreter>'.
+    """
+    planned = []
+    group = {}  # (python, options) -> packages, in first-seen order
+
+    def flush():
+        for (python, opts), pkgs in group.items():
+            if uv:
+                planned.append([uv, "pip", "install", "--python", python, *pkgs, *opts])
+            else:
+                planned.append([python, "-m", "pip", "install", *pkgs, *opts])
+        group.clear()
+
+    for cmd in installs:
+        parsed = _split_pip_install(cmd)
+        if parsed is None:
+            flush()
+            planned.append(cmd)
+            continue
+        python, pkgs, opts = parsed
+        bucket = group.setdefault((python, opts), [])
+        bucket.extend(p for p in pkgs if p not in bucket)
+    flush()
+    return planned
+
+
 def _get_installed_torch_mode() -> tuple[str, str | None, bool]:
     """Return installed torch mode as ('gpu'|'cpu'|'missing', version, cuda_ready)."""
     cuda_ready = verify_cuda_torch()
@@ -62,6 +176,459 @@ def _get_installed_torch_mode() -> tuple[str, str | None, bool]:
     return "missing", None, False
 
 
+# ─── Persistent Package Probe Cache ───────────────────────────────────────────
+
+PROBE_CACHE_FILE = os.path.join(LOG_DIR, "probe_cache.json")
+
+_PROBE_LOCK = threading.Lock()
+# distribution name -> {"sig": site signature, "installed": bool}
+_PROBE_CACHE: dict | None = None
+
+
+def _site_signature() -> list:
+    """Interpreter plus the stat of every site-packages directory.
+
+    Installing or removing a distribution adds/removes a dist-info entry,
+    which changes its directory's mtime and invalidates cached results.
+    """
+    import site
+    import sysconfig
+    from amv.scan_cache import dir_signature
+
+    paths = sysconfig.get_paths()
+    dirs = sorted({paths["purelib"], paths["platlib"], site.getusersitepackages()})
+    return [sys.executable, *(dir_signature(d) for d in dirs)]
+
+
+def _probe_cache() -> dict:
+    """Return the on-disk package probe cache, loading it on first use."""
+    global _PROBE_CACHE
+    if _PROBE_CACHE is None:
+        try:
+            with open(PROBE_CACHE_FILE, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = None
+        _PROBE_CACHE = data if isinstance(data, dict) else {}
+    return _PROBE_CACHE
+
+
+def _probe_cached(name: str, sig: list, probe) -> bool:
+    """Return probe() for a package, reusing the saved result while sig matches."""
+    with _PROBE_LOCK:
+        entry = _probe_cache().get(name)
+    if isinstance(entry, dict) and entry.get("sig") == sig:
+        return bool(entry.get("installed"))
+
+    installed = probe()
+    with _PROBE_LOCK:
+        cache = _probe_cache()
+        cache[name] = {"sig": sig, "installed": installed}
+        tmp = f"{PROBE_CACHE_FILE}.tmp"
+        try:
+            os.makedirs(LOG_DIR, exist_ok=True)
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(cache, f)
+            os.replace(tmp, PROBE_CACHE_FILE)
+        except OSError:
+            pass
+    return installed
+
+
+# pip's own chatter, never the cause of a failure
+_PIP_NOISE_RE = re.compile(r"^\s*\[notice\]|A new release of pip|To update, run:")
+_PIP_ERROR_RE = re.compile(r"error:", re.IGNORECASE)
+
+
+def _pip_error_message(lines, returncode: int) -> str:
+    """Pick the most informative line from the tail of a failed install's output.
+
+    Prefers the last 'ERROR:'/'error:' line, else the last non-notice line.
+    """
+    real_errors = [
+        line for line in lines
+        if line.strip() and not _PIP_NOISE_RE.search(line)
+    ]
+    if not real_errors:
+        return f"exit code {returncode}"
+    error_lines = [line for line in real_errors if _PIP_ERROR_RE.search(line)]
+    err_msg = error_lines[-1] if error_lines else real_errors[-1]
+
+    # Provide user-friendly message for common errors
+    if "Access is denied" in err_msg or "WinError 5" in err_msg:
+        return "File locked - close other AMV/Python instances and retry"
+    return err_msg
+
+
+def _run_probes(probes: dict) -> dict:
+    """Run independent probe callables concurrently; return {key: result}.
+
+    The probes are I/O bound (nvidia-smi, torch import, dist-info reads),
+    so the wall time is roughly the slowest probe instead of their sum.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=len(probes)) as pool:
+        futures = {key: pool.submit(fn) for key, fn in probes.items()}
+        return {key: future.result() for key, future in futures.items()}
+
+
+# Status table markup shared by the check flows
+_INSTALLED = "[green]Installed[/green]"
+_MISSING = "[red]Missing[/red]"
+_ROW_DETECTED_GPU = "[cyan]Detected GPU[/cyan]"
+_ROW_CURRENT_MODE = "[cyan]Current Mode[/cyan]"
+_ROW_TARGET_MODE = "[cyan]Target Mode[/cyan]"
+_ROW_PYTORCH = "[cyan]PyTorch[/cyan]"
+_ROW_CUDA_PYTORCH = "[cyan]CUDA PyTorch[/cyan]"
+_ROW_CPU_PYTORCH = "[cyan]CPU PyTorch[/cyan]"
+_ROW_ONNX = "[cyan]ONNX Runtime[/cyan]"
+_ROW_FFMPEG = "[cyan]FFmpeg[/cyan]"
+_ROW_YTDLP = "[cyan]yt-dlp[/cyan]"
+_ROW_SEPARATOR = "[cyan]audio-separator[/cyan]"
+
+
+# Last auto-detect results: (time.monotonic() when collected, results).
+# Primed when the main menu highlights System Check, so it can render
+# without waiting on probes.
+_LAST_RESULTS: tuple[float, dict] | None = None
+_RESULTS_TTL = 30.0
+# Prime still running, so the screen can wait for it instead of probing twice
+_PRIME_FUTURE: Future | None = None
+_PRIME_LOCK = threading.Lock()
+
+
+def _recent_results() -> dict | None:
+    """Return the last auto-detect results if they're still fresh."""
+    last = _LAST_RESULTS
+    if last is not None and time.monotonic() - last[0] < _RESULTS_TTL:
+        return last[1]
+    return None
+
+
+def _forget_results() -> None:
+    """Drop cached auto-detect results after anything they depend on changes."""
+    global _LAST_RESULTS
+    _LAST_RESULTS = None
+
+
+# Dependency probe results shared by every check pass:
+# key -> (time.monotonic() when checked, result). Cleared after installs.
+_DEP_CACHE: dict[str, tuple[float, object]] = {}
+_DEP_TTL = 30.0
+
+
+def _dep_cached(key: str, fn, ttl: float = _DEP_TTL):
+    """Return fn() from the dependency cache, calling it if stale or missing."""
+    now = time.monotonic()
+    hit = _DEP_CACHE.get(key)
+    if hit is not None and now - hit[0] < ttl:
+        return hit[1]
+    value = fn()
+    _DEP_CACHE[key] = (now, value)
+    return value
+
+
+def _check_command(cmd: str) -> bool:
+    """Check if a command exists in PATH."""
+    return _dep_cached(f"cmd:{cmd}", lambda: shutil.which(cmd) is not None)
+
+
+def _check_package(package: str) -> bool:
+    """Check if a Python package is installed (reads dist-info, no pip run).
+
+    Accepts a requirement string; extras and version specifiers are ignored.
+    """
+    name = _dist_name(package)
+
+    def probe():
+        from importlib.metadata import distribution, PackageNotFoundError
+        try:
+            distribution(name)
+            return True
+        except PackageNotFoundError:
+            return False
+        except Exception as e:
+            # Unreadable/corrupt dist-info - let pip decide instead
+            _get_logger().debug(f"metadata lookup for {name} failed ({e}); asking pip")
+            return name in _pip_installed()
+    return _dep_cached(
+        f"pkg:{name}", lambda: _probe_cached(name, _site_signature(), probe)
+    )
+
+
+def _pip_installed() -> frozenset[str]:
+    """Slow path: normalized names from one 'pip list', shared by all packages."""
+    def probe():
+        try:
+            result = subprocess.run(
+                [sys.executable, "-m", "pip", "list", "--format=json",
+                 "--disable-pip-version-check"],
+                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                text=True, timeout=60,
+            )
+            packages = json.loads(result.stdout) if result.returncode == 0 else []
+        except (OSError, subprocess.TimeoutExpired, ValueError):
+            packages = []
+        return frozenset(
+            _dist_name(p["name"]) for p in packages
+            if isinstance(p, dict) and isinstance(p.get("name"), str)
+        )
+    return _dep_cached("pip:list", probe)
+
+
+def _collect_results(target_mode: str | None = None) -> dict:
+    """Run the checks for target_mode (None = auto-detect) and plan the installs."""
+    global _LAST_RESULTS
+    # Read once per pass; reused when the success state saves the mode
+    config = load_config()
+    if target_mode == "gpu":
+        results = _collect_gpu_switch()
+    elif target_mode == "cpu":
+        results = _collect_cpu_switch()
+    else:
+        results = _collect_dependency_check(config)
+    results["config"] = config
+    results["installs"] = _plan_installs(results["installs"], shutil.which("uv"))
+    if target_mode is None:
+        _LAST_RESULTS = (time.monotonic(), results)
+    return results
+
+
+# ─── Mode Switch Flows ────────────────────────────────────────────────────────
+
+
+def _collect_gpu_switch() -> dict:
+    """Collect data for switching to GPU mode."""
+    issues = []
+    installs = []
+    rows = []
+
+    probes = _run_probes({
+        "gpu": check_nvidia_gpu,
+        "torch": _get_installed_torch_mode,
+    })
+    gpu_name = probes["gpu"]
+    if gpu_name:
+        rows.append((_ROW_DETECTED_GPU, f"[green]{gpu_name}[/green]"))
+    else:
+        rows.append((_ROW_DETECTED_GPU, "[red]No NVIDIA GPU found[/red]"))
+
+    installed_mode, torch_ver, _ = probes["torch"]
+    mode_label = "NOT INSTALLED" if installed_mode == "missing" else installed_mode.upper()
+    rows.append((_ROW_CURRENT_MODE, f"{mode_label}"))
+    rows.append((_ROW_TARGET_MODE, "[bold #50fa7b]GPU (CUDA 12.8 / cu128)[/bold #50fa7b]"))
+
+    if installed_mode == "gpu":
+        if torch_ver:
+            rows.append((_ROW_PYTORCH, f"[green]{torch_ver} (CUDA)[/green]"))
+        rows.append((_ROW_CUDA_PYTORCH, "[green]Already installed[/green]"))
+        return {
+            "rows": rows,
+            "issues": [],
+            "installs": [],
+            "success_mode": "gpu",
+            "gpu_name": gpu_name,
+            # Nothing was installed, so the hardware cache is still valid
+            "refresh_hardware": False,
+        }
+
+    rows.append((_ROW_CUDA_PYTORCH, "[yellow]Needs install (cu128 for SM_120)[/yellow]"))
+
+    installs = list(get_gpu_switch_cmds())
+    issues = [
+        "Uninstall CPU-only torch",
+        "Install PyTorch with CUDA 12.8 (cu128) for RTX 50 series",
+        "Install audio-separator[gpu]",
+    ]
+    return {
+        "rows": rows,
+        "issues": issues,
+        "installs": installs,
+        "success_mode": None,
+        "gpu_name": gpu_name,
+    }
+
+
+def _collect_cpu_switch() -> dict:
+    """Collect data for switching to CPU mode."""
+    issues = []
+    installs = []
+    rows = []
+
+    installed_mode, torch_ver, _ = _get_installed_torch_mode()
+    mode_label = "NOT INSTALLED" if installed_mode == "missing" else installed_mode.upper()
+    rows.append((_ROW_CURRENT_MODE, f"{mode_label}"))
+    rows.append((_ROW_TARGET_MODE, "[bold #ffb86c]CPU[/bold #ffb86c]"))
+
+    if installed_mode == "cpu":
+        if torch_ver:
+            rows.append((_ROW_PYTORCH, f"[green]{torch_ver}[/green]"))
+        rows.append((_ROW_CPU_PYTORCH, "[green]Already installed[/green]"))
+        return {
+            "rows": rows,
+            "issues": [],
+            "installs": [],
+            "success_mode": "cpu",
+            "gpu_name": None,
+            # Nothing was installed, so the hardware cache is still valid
+            "refresh_hardware": False,
+        }
+
+    if installed_mode == "missing":
+        rows.append((_ROW_CPU_PYTORCH, "[yellow]Needs install (PyTorch missing)[/yellow]"))
+    else:
+        rows.append((_ROW_CPU_PYTORCH, "[yellow]Needs install[/yellow]"))
+
+    installs = list(get_cpu_switch_cmds())
+    issues = [
+        "Uninstall CUDA torch",
+        "Install CPU-only PyTorch",
+        "Install onnxruntime for ONNX models",
+    ]
+    return {
+        "rows": rows,
+        "issues": issues,
+        "installs": installs,
+        "success_mode": None,
+        "gpu_name": None,
+    }
+
+
+# ─── Auto-Detect Flow ─────────────────────────────────────────────────────────
+
+
+def _collect_dependency_check(config: dict) -> dict:
+    """Collect dependency status without touching the UI."""
+    issues = []
+    installs = []
+    rows = []
+
+    force_cpu = config.get("force_cpu", False)
+
+    def hw_and_torch():
+        # Sequential: torch status is read from the cache refresh_vram rebuilds.
+        # Forced, so a stale saved result can't outlive a System Check.
+        return refresh_vram(config, force=True), _get_installed_torch_mode()
+
+    probes = {
+        "hw": hw_and_torch,
+        "ort": lambda: _check_package("onnxruntime"),
+        "ffmpeg": lambda: _check_command("ffmpeg"),
+        "ytdlp": lambda: _check_command("yt-dlp"),
+        "separator": lambda: _check_package("audio-separator"),
+    }
+    if force_cpu:
+        probes["gpu"] = check_nvidia_gpu
+    probes = _run_probes(probes)
+
+    hw_info, torch_mode = probes["hw"]
+    gpu_name = None
+    if force_cpu:
+        gpu_name = probes["gpu"]
+    elif hw_info.get("gpu_type") == "nvidia":
+        gpu_name = hw_info.get("device")
+        if gpu_name and " (CUDA torch not installed)" in gpu_name:
+            gpu_name = gpu_name.replace(" (CUDA torch not installed)", "")
+
+    if gpu_name:
+        rows.append((_ROW_DETECTED_GPU, f"[green]{gpu_name}[/green]"))
+    else:
+        rows.append(("[cyan]Detected Hardware[/cyan]", hw_info["device"]))
+
+    # Check what's actually installed rather than what config says
+    installed_mode, torch_ver, cuda_ready = torch_mode
+    actual_mode = "gpu" if installed_mode == "gpu" else "cpu"
+    rows.append((_ROW_CURRENT_MODE, f"[bold]{actual_mode.upper()}[/bold]"))
+
+    if installed_mode != "missing":
+        if cuda_ready:
+            rows.append((_ROW_PYTORCH, f"[green]{torch_ver} (CUDA)[/green]"))
+        else:
+            rows.append((_ROW_PYTORCH, f"[green]{torch_ver}[/green]"))
+    else:
+        rows.append((_ROW_PYTORCH, _MISSING))
+        issues.append("PyTorch: Missing")
+        installs.append(get_torch_install_cmd(False))
+
+    if probes["ort"]:
+        rows.append((_ROW_ONNX, _INSTALLED))
+    else:
+        rows.append((_ROW_ONNX, _MISSING))
+        issues.append("onnxruntime: Missing")
+        installs.append([sys.executable, "-m", "pip", "install", "onnxruntime"])
+
+    if probes["ffmpeg"]:
+        rows.append((_ROW_FFMPEG, _INSTALLED))
+    else:
+        rows.append((_ROW_FFMPEG, _MISSING))
+        issues.append("ffmpeg: Missing (install from ffmpeg.org)")
+
+    if probes["ytdlp"]:
+        rows.append((_ROW_YTDLP, _INSTALLED))
+    else:
+        rows.append((_ROW_YTDLP, _MISSING))
+        issues.append("yt-dlp: Missing")
+        installs.append([sys.executable, "-m", "pip", "install", "yt-dlp"])
+
+    as_pkg = "audio-separator[gpu]" if cuda_ready else "audio-separator"
+    if probes["separator"]:
+        rows.append((_ROW_SEPARATOR, _INSTALLED))
+    else:
+        rows.append((_ROW_SEPARATOR, _MISSING))
+        issues.append("audio-separator: Missing")
+        installs.append([sys.executable, "-m", "pip", "install", as_pkg])
+
+    # Offer optional GPU switch when CPU deps are complete but a GPU exists
+    gpu_switch_available = bool(gpu_name) and not cuda_ready and not issues
+
+    return {
+        "rows": rows,
+        "issues": issues,
+        "installs": installs,
+        "success_mode": actual_mode if not issues else None,
+        "gpu_name": gpu_name,
+        "gpu_switch_available": gpu_switch_available,
+        "refresh_hardware": False,
+    }
+
+
+def prime_setup_cache() -> None:
+    """Run the auto-detect checks ahead of time, for use from a background thread.
+
+    Builds no widgets, and does nothing while earlier results are still fresh
+    or another prime is already running.
+    """
+    global _PRIME_FUTURE
+    with _PRIME_LOCK:
+        if _PRIME_FUTURE is not None or _recent_results() is not None:
+            return
+        future = _PRIME_FUTURE = Future()
+    try:
+        future.set_result(_collect_results())
+    except Exception as e:
+        _get_logger().debug(f"Setup cache priming failed: {e}")
+        future.set_exception(e)
+    finally:
+        with _PRIME_LOCK:
+            _PRIME_FUTURE = None
+
+
+def _primed_results() -> dict | None:
+    """Return fresh auto-detect results, waiting for a running prime if there is one.
+
+    None means the caller has to run the checks itself.
+    """
+    with _PRIME_LOCK:
+        future = _PRIME_FUTURE
+    if future is not None:
+        try:
+            return future.result()
+        except Exception:
+            return None
+    return _recent_results()
+
+
 class SetupScreen(Screen):
     """Setup screen for dependency checking, installation, and mode switching.
 
@@ -81,9 +648,17 @@ class SetupScreen(Screen):
         super().__init__()
         self.target_mode = target_mode  # "gpu", "cpu", or None (auto)
         self.issues = []
-        self.installs = []       # list of list[str] (arg lists for subprocess)
+        self.installs = []       # list of arg sequences for subprocess
         self.is_installing = False
         self.gpu_name = None
+        self._row_values: dict[str, str] = {}  # status table: component -> status
+        self._recheck_pending = False
+        self._recheck_subtitle = None
+        self._shown = False
+        # Latest installer output line (written by the worker) and what's on screen
+        self._pending_detail: str | None = None
+        self._shown_detail: str | None = None
+        self._detail_timer = None
         self._logger = _get_logger()
 
     def compose(self) -> ComposeResult:
@@ -133,8 +708,30 @@ class SetupScreen(Screen):
         elif self.target_mode == "cpu":
             subtitle = "[dim]Switching to CPU mode[/dim]"
 
-        self._show_checking_state(subtitle)
         self._logger.info(f"Setup opened: target_mode={self.target_mode}")
+        table = self.query_one("#status-table", DataTable)
+        table.add_column("Component", key="component")
+        table.add_column("Status", key="status")
+        self._restart_checks(subtitle)
+
+    def on_screen_resume(self) -> None:
+        """Re-run checks when the installed "setup" screen is shown again.
+
+        Named screens are built once and reused, so on_mount only covers
+        the first visit.
+        """
+        if not self._shown:
+            self._shown = True
+        elif not self.is_installing:
+            self._request_recheck()
+
+    def _restart_checks(self, subtitle: str | None = None) -> None:
+        """Show the checking state and run the checks in a worker thread.
+
+        This is the only entry point for checks, so the probes (pip metadata,
+        nvidia-smi, torch import) never run on the UI thread.
+        """
+        self._show_checking_state(subtitle)
         self.run_worker(self._run_initial_checks, thread=True, exclusive=True)
 
     def _show_checking_state(self, subtitle: str | None = None) -> None:
@@ -142,11 +739,7 @@ class SetupScreen(Screen):
         if subtitle:
             self.query_one("#subtitle", Static).update(subtitle)
 
-        table = self.query_one("#status-table", DataTable)
-        table.clear(columns=True)
-        table.add_column("Component", key="component")
-        table.add_column("Status", key="status")
-        table.add_row("[cyan]Status[/cyan]", "[dim]Checking system...[/dim]")
+        self._set_table_rows([("[cyan]Status[/cyan]", "[dim]Checking system...[/dim]")])
 
         self.query_one("#issues-panel").add_class("hidden")
         self.query_one("#action-buttons").add_class("hidden")
@@ -159,198 +752,31 @@ class SetupScreen(Screen):
 
     def _run_initial_checks(self) -> None:
         """Run setup checks in a worker thread."""
-        if self.target_mode == "gpu":
-            results = self._collect_gpu_switch()
-        elif self.target_mode == "cpu":
-            results = self._collect_cpu_switch()
-        else:
-            results = self._collect_dependency_check()
+        results = _primed_results() if self.target_mode is None else None
+        if results is None:
+            results = _collect_results(self.target_mode)
         self.app.call_from_thread(self._apply_results, results)
 
-    # ─── Mode Switch Flows ────────────────────────────────────────────────────
-
-    def _collect_gpu_switch(self) -> dict:
-        """Collect data for switching to GPU mode."""
-        issues = []
-        installs = []
-        rows = []
-
-        gpu_name = check_nvidia_gpu()
-        if gpu_name:
-            rows.append(("[cyan]Detected GPU[/cyan]", f"[green]{gpu_name}[/green]"))
-        else:
-            rows.append(("[cyan]Detected GPU[/cyan]", "[red]No NVIDIA GPU found[/red]"))
-
-        installed_mode, torch_ver, _ = _get_installed_torch_mode()
-        mode_label = "NOT INSTALLED" if installed_mode == "missing" else installed_mode.upper()
-        rows.append(("[cyan]Current Mode[/cyan]", f"{mode_label}"))
-        rows.append(("[cyan]Target Mode[/cyan]", "[bold #50fa7b]GPU (CUDA 12.8 / cu128)[/bold #50fa7b]"))
-
-        if installed_mode == "gpu":
-            if torch_ver:
-                rows.append(("[cyan]PyTorch[/cyan]", f"[green]{torch_ver} (CUDA)[/green]"))
-            rows.append(("[cyan]CUDA PyTorch[/cyan]", "[green]Already installed[/green]"))
-            return {
-                "rows": rows,
-                "issues": [],
-                "installs": [],
-                "success_mode": "gpu",
-                "gpu_name": gpu_name,
-            }
-
-        rows.append(("[cyan]CUDA PyTorch[/cyan]", "[yellow]Needs install (cu128 for SM_120)[/yellow]"))
-
-        installs = get_gpu_switch_cmds()
-        issues = [
-            "Uninstall CPU-only torch",
-            "Install PyTorch with CUDA 12.8 (cu128) for RTX 50 series",
-            "Install audio-separator[gpu]",
-        ]
-        return {
-            "rows": rows,
-            "issues": issues,
-            "installs": installs,
-            "success_mode": None,
-            "gpu_name": gpu_name,
-        }
-
-    def _build_gpu_switch(self) -> None:
-        """Build the command list for switching to GPU mode."""
-        self._apply_results(self._collect_gpu_switch())
-
-    def _collect_cpu_switch(self) -> dict:
-        """Collect data for switching to CPU mode."""
-        issues = []
-        installs = []
-        rows = []
-
-        installed_mode, torch_ver, _ = _get_installed_torch_mode()
-        mode_label = "NOT INSTALLED" if installed_mode == "missing" else installed_mode.upper()
-        rows.append(("[cyan]Current Mode[/cyan]", f"{mode_label}"))
-        rows.append(("[cyan]Target Mode[/cyan]", "[bold #ffb86c]CPU[/bold #ffb86c]"))
-
-        if installed_mode == "cpu":
-            if torch_ver:
-                rows.append(("[cyan]PyTorch[/cyan]", f"[green]{torch_ver}[/green]"))
-            rows.append(("[cyan]CPU PyTorch[/cyan]", "[green]Already installed[/green]"))
-            return {
-                "rows": rows,
-                "issues": [],
-                "installs": [],
-                "success_mode": "cpu",
-                "gpu_name": None,
-            }
-
-        if installed_mode == "missing":
-            rows.append(("[cyan]CPU PyTorch[/cyan]", "[yellow]Needs install (PyTorch missing)[/yellow]"))
-        else:
-            rows.append(("[cyan]CPU PyTorch[/cyan]", "[yellow]Needs install[/yellow]"))
-
-        installs = get_cpu_switch_cmds()
-        issues = [
-            "Uninstall CUDA torch",
-            "Install CPU-only PyTorch",
-            "Install onnxruntime for ONNX models",
-        ]
-        return {
-            "rows": rows,
-            "issues": issues,
-            "installs": installs,
-            "success_mode": None,
-            "gpu_name": None,
-        }
-
-    def _build_cpu_switch(self) -> None:
-        """Build the command list for switching to CPU mode."""
-        self._apply_results(self._collect_cpu_switch())
-
-    # ─── Auto-Detect Flow ─────────────────────────────────────────────────────
-
-    def _collect_dependency_check(self) -> dict:
-        """Collect dependency status without touching the UI."""
-        issues = []
-        installs = []
-        rows = []
-
-        config = load_config()
-        force_cpu = config.get("force_cpu", False)
-
-        hw_info = refresh_vram()
-        gpu_name = None
-        if force_cpu:
-            gpu_name = check_nvidia_gpu()
-        elif hw_info.get("gpu_type") == "nvidia":
-            gpu_name = hw_info.get("device")
-            if gpu_name and " (CUDA torch not installed)" in gpu_name:
-                gpu_name = gpu_name.replace(" (CUDA torch not installed)", "")
-
-        if gpu_name:
-            rows.append(("[cyan]Detected GPU[/cyan]", f"[green]{gpu_name}[/green]"))
-        else:
-            rows.append(("[cyan]Detected Hardware[/cyan]", hw_info["device"]))
+    # ─── Helpers ──────────────────────────────────────────────────────────────
 
-        # Check what's actually installed rather than what config says
-        installed_mode, torch_ver, cuda_ready = _get_installed_torch_mode()
-        actual_mode = "gpu" if installed_mode == "gpu" else "cpu"
-        rows.append(("[cyan]Current Mode[/cyan]", f"[bold]{actual_mode.upper()}[/bold]"))
+    def _set_table_rows(self, rows) -> None:
+        """Show (component, status) rows, rewriting only cells that changed.
 
-        if installed_mode != "missing":
-            if cuda_ready:
-                rows.append(("[cyan]PyTorch[/cyan]", f"[green]{torch_ver} (CUDA)[/green]"))
+        The table is only rebuilt when the set of components differs.
+        """
+        table = self.query_one("#status-table", DataTable)
+        values = dict(rows)
+        # One refresh for the whole update rather than one per row
+        with self.app.batch_update():
+            if list(values) == list(self._row_values):
+                # Same components in the same order, so row i is still component i
+                for row, (component, status) in enumerate(values.items()):
+                    if self._row_values[component] != status:
+                        table.update_cell_at(Coordinate(row, 1), status)
             else:
-                rows.append(("[cyan]PyTorch[/cyan]", f"[green]{torch_ver}[/green]"))
-        else:
-            rows.append(("[cyan]PyTorch[/cyan]", "[red]Missing[/red]"))
-            issues.append("PyTorch: Missing")
-            installs.append(get_torch_install_cmd(False))
-
-        ort_avail = self._check_package("onnxruntime")
-        if ort_avail:
-            rows.append(("[cyan]ONNX Runtime[/cyan]", "[green]Installed[/green]"))
-        else:
-            rows.append(("[cyan]ONNX Runtime[/cyan]", "[red]Missing[/red]"))
-            issues.append("onnxruntime: Missing")
-            installs.append([sys.executable, "-m", "pip", "install", "onnxruntime"])
-
-        if self._check_command("ffmpeg"):
-            rows.append(("[cyan]FFmpeg[/cyan]", "[green]Installed[/green]"))
-        else:
-            rows.append(("[cyan]FFmpeg[/cyan]", "[red]Missing[/red]"))
-            issues.append("ffmpeg: Missing (install from ffmpeg.org)")
-
-        if self._check_command("yt-dlp"):
-            rows.append(("[cyan]yt-dlp[/cyan]", "[green]Installed[/green]"))
-        else:
-            rows.append(("[cyan]yt-dlp[/cyan]", "[red]Missing[/red]"))
-            issues.append("yt-dlp: Missing")
-            installs.append([sys.executable, "-m", "pip", "install", "yt-dlp"])
-
-        as_pkg = "audio-separator[gpu]" if cuda_ready else "audio-separator"
-        if self._check_package("audio-separator"):
-            rows.append(("[cyan]audio-separator[/cyan]", "[green]Installed[/green]"))
-        else:
-            rows.append(("[cyan]audio-separator[/cyan]", "[red]Missing[/red]"))
-            issues.append("audio-separator: Missing")
-            installs.append([sys.executable, "-m", "pip", "install", as_pkg])
-
-        # Offer optional GPU switch when CPU deps are complete but a GPU exists
-        gpu_switch_available = bool(gpu_name) and not cuda_ready and not issues
-
-        return {
-            "rows": rows,
-            "issues": issues,
-            "installs": installs,
-            "success_mode": actual_mode if not issues else None,
-            "gpu_name": gpu_name,
-            "gpu_switch_available": gpu_switch_available,
-            "refresh_hardware": False,
-        }
-
-    def _check_dependencies(self) -> None:
-        """Check all dependencies and populate status table."""
-        self._apply_results(self._collect_dependency_check())
-
-    # ─── Helpers ──────────────────────────────────────────────────────────────
+                table.clear()
+                table.add_rows(values.items())
+        self._row_values = values
 
     def _apply_results(self, results: dict) -> None:
         """Apply collected status results to the UI."""
@@ -358,12 +784,7 @@ class SetupScreen(Screen):
         self.installs = results["installs"]
         self.gpu_name = results.get("gpu_name")
 
-        table = self.query_one("#status-table", DataTable)
-        table.clear(columns=True)
-        table.add_column("Component", key="component")
-        table.add_column("Status", key="status")
-        for component, status in results["rows"]:
-            table.add_row(component, status)
+        self._set_table_rows(results["rows"])
 
         success_mode = results.get("success_mode")
         gpu_switch_available = results.get("gpu_switch_available", False)
@@ -371,6 +792,7 @@ class SetupScreen(Screen):
             self._show_success_for_mode(
                 success_mode,
                 refresh_hardware=results.get("refresh_hardware", True),
+                config=results.get("config"),
             )
             if gpu_switch_available:
                 self._show_gpu_hint()
@@ -379,29 +801,10 @@ class SetupScreen(Screen):
 
         self._logger.info(f"Setup check complete: target_mode={self.target_mode}, gpu_name={self.gpu_name}")
 
-    def _check_command(self, cmd: str) -> bool:
-        """Check if a command exists in PATH."""
-        try:
-            subprocess.run([cmd, "--version"], capture_output=True, timeout=5)
-            return True
-        except (FileNotFoundError, subprocess.TimeoutExpired, OSError):
-            return False
-
-    def _check_package(self, package: str) -> bool:
-        """Check if a Python package is installed."""
-        try:
-            result = subprocess.run(
-                [sys.executable, "-m", "pip", "show", package],
-                capture_output=True, text=True, timeout=10
-            )
-            return result.returncode == 0
-        except (FileNotFoundError, subprocess.TimeoutExpired, OSError):
-            return False
-
     def _show_issues(self) -> None:
         """Show issues panel and action buttons."""
         issues_text = "\n".join(f"  • {issue}" for issue in self.issues)
-        actions_text = "\n".join(f"  [cyan]{_fmt_cmd(cmd)}[/cyan]" for cmd in self.installs)
+        actions_text = "\n".join(f"  [cyan]{escape(_fmt_cmd(cmd))}[/cyan]" for cmd in self.installs)
 
         self.query_one("#issues-list", Static).update(issues_text)
         self.query_one("#actions-list", Static).update(actions_text)
@@ -410,9 +813,15 @@ class SetupScreen(Screen):
         self.query_one("#success-msg").add_class("hidden")
         self.query_one("#install-btn", Button).focus()
 
-    def _show_success_for_mode(self, mode: str, refresh_hardware: bool = True) -> None:
-        """Show success message and save config for the given mode."""
-        config = load_config()
+    def _show_success_for_mode(
+        self, mode: str, refresh_hardware: bool = True, config: dict | None = None
+    ) -> None:
+        """Show success message and save config for the given mode.
+
+        config is the dict the check pass already loaded; read from disk if None.
+        """
+        config = dict(config) if config is not None else load_config()
+        saved = (config.get("setup_type"), config.get("force_cpu"))
         if mode == "gpu":
             config["setup_type"] = "gpu"
             config["force_cpu"] = False
@@ -423,10 +832,14 @@ class SetupScreen(Screen):
             config["force_cpu"] = True
             label = "CPU"
             color = "#ffb86c"
-        save_config(config)
-
-        # Force hardware cache refresh so other screens pick up the change
-        if refresh_hardware:
+        config_changed = (config["setup_type"], config["force_cpu"]) != saved
+        if config_changed:
+            save_config(config)
+            _forget_results()
+
+        # Force hardware cache refresh so other screens pick up the change.
+        # Skipped when nothing was installed and force_cpu didn't change.
+        if refresh_hardware or config_changed:
             refresh_vram()
 
         self._logger.info(f"Config saved: setup_type={mode}, force_cpu={config['force_cpu']}")
@@ -457,20 +870,33 @@ class SetupScreen(Screen):
         elif event.button.id == "back-btn":
             self.action_go_back()
         elif event.button.id == "gpu-switch-btn":
-            self.target_mode = "gpu"
-            self._show_checking_state(
-                "[dim]Switching to GPU mode (CUDA 12.8 / RTX 50 series)[/dim]"
-            )
-            self.run_worker(self._run_initial_checks, thread=True, exclusive=True)
+            # A screen of its own: this one may be the reused "setup" screen,
+            # which must stay in auto-detect mode for later visits
+            self.app.push_screen(SetupScreen(target_mode="gpu"))
+
+    def _request_recheck(self, subtitle: str | None = None) -> None:
+        """Schedule a re-check, collapsing a burst of requests into one run."""
+        self._recheck_subtitle = subtitle
+        if not self._recheck_pending:
+            self._recheck_pending = True
+            self.set_timer(0.25, self._do_recheck)
+
+    def _do_recheck(self) -> None:
+        self._recheck_pending = False
+        self._restart_checks(self._recheck_subtitle)
 
     def _start_installation(self) -> None:
         """Start installing/switching packages."""
+        if self.is_installing:
+            return
         self.is_installing = True
         self.query_one("#issues-panel").add_class("hidden")
         self.query_one("#action-buttons").add_class("hidden")
         self.query_one("#install-progress").remove_class("hidden")
         self._logger.info(f"Starting installation: {len(self.installs)} commands")
 
+        self._pending_detail = self._shown_detail = None
+        self._detail_timer = self.set_interval(INSTALL_UI_INTERVAL, self._flush_install_detail)
         self.run_worker(self._install_worker, thread=True, exclusive=True)
 
     def _install_worker(self) -> None:
@@ -491,54 +917,28 @@ class SetupScreen(Screen):
             self.app.call_from_thread(
                 self._update_install_status,
                 f"{step_label}...",
-                cmd_str,
+                escape(cmd_str),
             )
 
             try:
-                # cmd is always a list[str] now — safe for paths with spaces
-                result = subprocess.run(
-                    cmd, capture_output=True, text=True, timeout=600
-                )
-                # Log stdout/stderr regardless of exit code
-                if result.stdout.strip():
-                    for line in result.stdout.strip().splitlines()[-10:]:
-                        self._logger.debug(f"  stdout: {line}")
-                if result.stderr.strip():
-                    for line in result.stderr.strip().splitlines()[-10:]:
-                        self._logger.debug(f"  stderr: {line}")
-
-                if result.returncode != 0:
-                    # Filter out pip notices to find actual error message
-                    err_msg = f"exit code {result.returncode}"
-                    if result.stderr.strip():
-                        # Skip pip's informational notices and empty lines
-                        real_errors = [
-                            line for line in result.stderr.strip().splitlines()
-                            if line.strip()  # Skip empty lines
-                            and not line.strip().startswith("[notice]")
-                            and "A new release of pip" not in line
-                            and "To update, run:" not in line
-                        ]
-                        if real_errors:
-                            # Find the most informative error line (prefer ERROR: lines)
-                            error_lines = [l for l in real_errors if "ERROR:" in l or "error:" in l.lower()]
-                            err_msg = error_lines[-1] if error_lines else real_errors[-1]
-                            
-                            # Provide user-friendly message for common errors
-                            if "Access is denied" in err_msg or "WinError 5" in err_msg:
-                                err_msg = "File locked - close other AMV/Python instances and retry"
-                    self._logger.error(f"  FAILED ({result.returncode}): {err_msg}")
+                returncode, tail = self._run_install_step(cmd, worker)
+                if returncode is None:
+                    self._logger.warning("Installation cancelled by user")
+                    return
+                if returncode != 0:
+                    err_msg = _pip_error_message(tail, returncode)
+                    self._logger.error(f"  FAILED ({returncode}): {err_msg}")
                     errors.append(f"Step {i+1}: {err_msg}")
                     self.app.call_from_thread(
                         self._update_install_status,
                         f"[red]{step_label} FAILED[/red]",
-                        f"[red]{err_msg}[/red]",
+                        f"[red]{escape(err_msg)}[/red]",
                     )
                 else:
                     self._logger.info(f"  OK")
 
             except subprocess.TimeoutExpired:
-                self._logger.error(f"  TIMEOUT after 600s")
+                self._logger.error(f"  TIMEOUT after {INSTALL_TIMEOUT}s")
                 errors.append(f"Step {i+1}: Timed out")
             except Exception as e:
                 self._logger.error(f"  EXCEPTION: {e}")
@@ -551,6 +951,72 @@ class SetupScreen(Screen):
             self._logger.info("Installation finished successfully")
             self.app.call_from_thread(self._install_complete)
 
+    def _run_install_step(self, cmd, worker) -> tuple[int | None, deque]:
+        """Run one install command, streaming its output to the progress panel.
+
+        Only the last lines of output are kept (for error reporting), so a
+        large torch install doesn't buffer pip's whole log in memory.
+
+        Returns:
+            (returncode, tail) - returncode is None if the worker was cancelled.
+
+        Raises:
+            subprocess.TimeoutExpired: If the step exceeds INSTALL_TIMEOUT.
+        """
+        tail = deque(maxlen=50)
+        deadline = time.monotonic() + INSTALL_TIMEOUT
+        proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+            errors="replace",
+        )
+        # Kills the step even if it hangs without printing anything
+        watchdog = threading.Timer(INSTALL_TIMEOUT, proc.kill)
+        watchdog.daemon = True
+        watchdog.start()
+        try:
+            for line in proc.stdout:
+                line = line.rstrip()
+                if not line:
+                    continue
+                tail.append(line)
+                # Full output goes to the log file as it arrives
+                self._logger.debug(f"  output: {line}")
+                # Picked up by the UI-side interval; no cross-thread call per line
+                self._pending_detail = line[:120]
+                if worker.is_cancelled:
+                    proc.kill()
+                    proc.wait()
+                    return None, tail
+            proc.wait()
+        except BaseException:
+            proc.kill()
+            proc.wait()
+            raise
+        finally:
+            watchdog.cancel()
+            proc.stdout.close()
+        if proc.returncode != 0 and time.monotonic() >= deadline:
+            raise subprocess.TimeoutExpired(cmd, INSTALL_TIMEOUT)
+        return proc.returncode, tail
+
+    def _flush_install_detail(self) -> None:
+        """Show the latest line of installer output if it changed since last tick."""
+        line = self._pending_detail
+        if line is not None and line != self._shown_detail:
+            self._shown_detail = line
+            self.query_one("#install-detail", Static).update(f"[dim]{escape(line)}[/dim]")
+
+    def _stop_install_detail(self) -> None:
+        if self._detail_timer is not None:
+            self._detail_timer.stop()
+            self._detail_timer = None
+        self._flush_install_detail()
+
     def _update_install_status(self, label: str, status: str) -> None:
         """Update installation status display."""
         self.query_one("#install-label", Label).update(label)
@@ -558,6 +1024,12 @@ class SetupScreen(Screen):
 
     def _install_complete(self) -> None:
         """Installation succeeded."""
+        from amv.screens.settings import invalidate_cache
+        _DEP_CACHE.clear()
+        verify_cuda_torch.cache_clear()
+        _forget_results()
+        invalidate_cache()
+        self._stop_install_detail()
         self.is_installing = False
         self.query_one("#install-progress").add_class("hidden")
 
@@ -570,10 +1042,17 @@ class SetupScreen(Screen):
 
     def _install_failed(self, errors: list[str]) -> None:
         """Installation had errors — show them."""
+        # Some steps may still have changed what's installed
+        from amv.screens.settings import invalidate_cache
+        _DEP_CACHE.clear()
+        verify_cuda_torch.cache_clear()
+        _forget_results()
+        invalidate_cache()
+        self._stop_install_detail()
         self.is_installing = False
         self.query_one("#install-progress").add_class("hidden")
         self.query_one("#success-msg").remove_class("hidden")
-        error_text = "\n".join(f"  [red]• {e}[/red]" for e in errors)
+        error_text = "\n".join(f"  [red]• {escape(e)}[/red]" for e in errors)
         self.query_one("#success-msg", Static).update(
             f"[bold #ff5555]❌ Installation failed[/bold #ff5555]\n\n"
             f"{error_text}\n\n"
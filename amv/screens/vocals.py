@@ -4,6 +4,11 @@
 # ═══════════════════════════════════════════════════════════════════════════════
 
 import os
+import time
+import functools
+import itertools
+import threading
+from collections import deque
 from textual.app import ComposeResult
 from textual.widgets import Footer, Static, Label, Button, Input
 from textual.containers import Vertical, Center
@@ -11,18 +16,146 @@ from textual.worker import get_current_worker
 
 from textual.screen import Screen
 from amv.widgets.menu import StyledOptionList, create_menu_option
-from amv.config import add_recent_file
+from amv.config import add_recent_file, get_original_dir
 from amv.hardware import get_hw_info, refresh_vram
 from amv.models import get_active_model, get_model_display_name
 from amv.notify import notify_complete
 
-AUDIO_EXTENSIONS = {'wav', 'mp3', 'flac', 'm4a', 'mp4', 'mkv', 'avi', 'webm', 'mov'}
+VIDEO_EXTENSIONS = frozenset({'mp4', 'mkv', 'avi', 'webm', 'mov'})
+AUDIO_EXTENSIONS = frozenset({'wav', 'mp3', 'flac', 'm4a'}) | VIDEO_EXTENSIONS
+AUDIO_SUFFIXES = tuple(sorted(f'.{ext}' for ext in AUDIO_EXTENSIONS))  # for str.endswith
 
 # Directories to skip during deep scan
-SKIP_DIRS = {
+SKIP_DIRS = frozenset({
     '.git', 'node_modules', '.venv', '__pycache__', 'venv', 'env', '.tox',
     '$Recycle.Bin', 'System Volume Information', 'AppData', '.cache', '.local',
-}
+})
+
+# Max files a scan collects, and how many of them the suggestion list shows
+SCAN_LIMIT = 200
+LIST_LIMIT = 20
+# Directories listed concurrently during a scan
+SCAN_WORKERS = min(16, (os.cpu_count() or 4) * 2)
+# How long a directory's unfiltered scan is reused while the user types,
+# and how many directories are remembered
+SCAN_TTL = 10.0
+SCAN_CACHE_SIZE = 32
+# Minimum seconds between hardware re-probes when the screen is re-entered
+HW_REFRESH_INTERVAL = 30.0
+
+# Listing pool shared by every scan; None = not created yet
+_SCAN_POOL = None
+_SCAN_POOL_LOCK = threading.Lock()
+
+
+def _list_dir(path: str) -> tuple[tuple | None, list, list]:
+    """Return (identity, media files, subdirectories to descend into) of one directory.
+
+    The identity is (st_dev, st_ino), or None where the filesystem reports
+    no inode number.
+    """
+    files, dirs = [], []
+    try:
+        st = os.stat(path)
+        it = os.scandir(path)
+    except OSError:
+        return None, files, dirs
+    ident = (st.st_dev, st.st_ino) if st.st_ino else None
+    # Bound once: this loop runs for every entry in the tree
+    add_file, add_dir = files.append, dirs.append
+    skip_dirs, suffixes = SKIP_DIRS, AUDIO_SUFFIXES
+    with it:
+        for entry in it:
+            name = entry.name
+            try:
+                # DirEntry caches d_type, so this needs no extra stat
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                continue
+            if is_dir:
+                if name not in skip_dirs and not name.startswith('.'):
+                    add_dir(entry.path)
+                continue
+            f_lower = name.lower()
+            if not f_lower.endswith(suffixes):
+                continue
+            # Skip our own outputs; most names have no bracket at all, so the
+            # first test settles them in a single pass
+            if '[' in f_lower and ("[vocals]" in f_lower or "[instrumental]" in f_lower):
+                continue
+            try:
+                # Free from d_type too, except for symlinks, which get one stat
+                # so links to files count and dangling ones don't
+                if not entry.is_file():
+                    continue
+            except OSError:  # Some network filesystems refuse; skip the entry
+                continue
+            add_file(entry.path)
+    return ident, files, dirs
+
+def _scan_pool():
+    """Return the thread pool directory listings run on, creating it on first use.
+
+    One pool serves every scan, so a scan per debounced keystroke doesn't
+    start and stop its own set of threads.
+    """
+    global _SCAN_POOL
+    with _SCAN_POOL_LOCK:
+        if _SCAN_POOL is None:
+            from concurrent.futures import ThreadPoolExecutor
+            _SCAN_POOL = ThreadPoolExecutor(
+                max_workers=SCAN_WORKERS, thread_name_prefix="amv-scan"
+            )
+        return _SCAN_POOL
+
+def _iter_media_files(directory: str, cancel: threading.Event | None = None):
+    """Yield media file paths under directory, breadth-first.
+
+    Files nearest the root come first, so a capped scan shows the top of
+    the tree rather than one deep corner of it. Listings run on a thread
+    pool (readdir is I/O bound, so overlapping it hides most per-directory
+    latency on network drives and cold caches), but at most a couple of
+    batches ahead of the one being consumed, so stopping early wastes
+    little work. Output order doesn't depend on thread timing.
+
+    A directory reached twice (bind mounts, junctions, or a filesystem
+    looped back into itself) is only walked the first time.
+    """
+    queued = deque([directory])  # Found but not yet submitted
+    listing = deque()  # Submitted, in breadth-first order
+    seen = set()  # (st_dev, st_ino) of directories already walked
+    pool = _scan_pool()
+    try:
+        while queued or listing:
+            while queued and len(listing) < SCAN_WORKERS * 2:
+                listing.append(pool.submit(_list_dir, queued.popleft()))
+            ident, files, dirs = listing.popleft().result()
+            if cancel is not None and cancel.is_set():
+                return
+            if ident is not None:
+                if ident in seen:
+                    continue
+                seen.add(ident)
+            yield from files
+            queued.extend(dirs)
+    finally:
+        # Drop listings that are no longer needed; the pool stays up for the
+        # next scan
+        for future in listing:
+            future.cancel()
+
+
+@functools.lru_cache(maxsize=16)
+def _hw_status_markup(gpu: bool, device: str, vram: str | None,
+                      fp16: bool, model_name: str) -> str:
+    """Badge markup for the hardware line; cached since it rarely changes."""
+    if gpu:
+        # GPU mode: green badge with model + FP16
+        vram_tag = f" ({vram})" if vram else ""
+        fp16_tag = " FP16" if fp16 else ""
+        return f"[bold #50fa7b]{device}{vram_tag} | {model_name}{fp16_tag}[/bold #50fa7b]"
+    # CPU mode: orange badge
+    return f"[bold #ffb86c]CPU | {model_name}[/bold #ffb86c]"
 
 
 class VocalsScreen(Screen):
@@ -39,7 +172,13 @@ class VocalsScreen(Screen):
         self.selected_file = None
         self.is_processing = False
         self._scan_timer = None
+        self._scan_cancel = threading.Event()
+        self._scan_dir = ""  # Directory the suggestion list shows
+        # directory -> (time.monotonic() when scanned, unfiltered results)
+        self._scan_cache: dict[str, tuple[float, list]] = {}
+        self._scan_lock = threading.Lock()
         self.active_model = None
+        self._last_hw_refresh = float("-inf")  # time.monotonic() of the last re-probe
 
     def compose(self) -> ComposeResult:
         with Vertical():
@@ -74,15 +213,36 @@ class VocalsScreen(Screen):
         """Initialize screen."""
         self._show_hw_status_loading()
         self.query_one("#path-input", Input).focus()
-        original_dir = os.environ.get('AMV_ORIGINAL_DIR', os.getcwd())
-        self._run_scan(original_dir, "")
-        self.run_worker(self._load_hw_status, thread=True, exclusive=True)
+        self._scan_dir = get_original_dir()
+        self._run_scan("")
+        self.call_after_refresh(self._preload_separator)
+
+    def _preload_separator(self) -> None:
+        """Import the separation backend while the user is still picking a file."""
+        def _import() -> None:
+            from amv.separator import preload
+            preload()
+
+        self.run_worker(_import, thread=True)
 
     def _show_hw_status_loading(self) -> None:
         self.query_one("#hw-status", Static).update("[dim]Detecting hardware...[/dim]")
 
+    def on_screen_resume(self) -> None:
+        """Refresh the hardware badge, re-probing at most every HW_REFRESH_INTERVAL.
+
+        Also runs on the first push. Within the interval the cached hardware
+        info is shown, which still reflects a mode switch made in setup since
+        setup refreshes that cache itself.
+        """
+        if time.monotonic() - self._last_hw_refresh >= HW_REFRESH_INTERVAL:
+            self.run_worker(self._load_hw_status, thread=True, exclusive=True)
+        else:
+            self._update_hw_status(get_hw_info())
+
     def _load_hw_status(self) -> None:
         hw_info = refresh_vram()
+        self._last_hw_refresh = time.monotonic()
         self.app.call_from_thread(self._update_hw_status, hw_info)
 
     def _update_hw_status(self, hw_info=None) -> None:
@@ -91,25 +251,13 @@ class VocalsScreen(Screen):
 
         # Auto-select model based on hardware
         self.active_model = get_active_model(hw_info)
-        model_name = get_model_display_name(self.active_model)
-
-        device = hw_info['device_short']
-        vram = f" ({hw_info['vram']})" if hw_info.get('vram') else ""
-
-        if hw_info.get("gpu_type") != "cpu":
-            # GPU mode: green badge with model + FP16
-            gpu_device = hw_info.get("device", device)
-            badge_style = "bold #50fa7b"
-            fp16_tag = " FP16" if hw_info.get("fp16_capable") else ""
-            self.query_one("#hw-status", Static).update(
-                f"[{badge_style}]{gpu_device}{vram} | {model_name}{fp16_tag}[/{badge_style}]"
-            )
-        else:
-            # CPU mode: orange badge
-            badge_style = "bold #ffb86c"
-            self.query_one("#hw-status", Static).update(
-                f"[{badge_style}]CPU | {model_name}[/{badge_style}]"
-            )
+        self.query_one("#hw-status", Static).update(_hw_status_markup(
+            hw_info.get("gpu_type") != "cpu",
+            hw_info.get("device", hw_info['device_short']),
+            hw_info.get('vram'),
+            bool(hw_info.get("fp16_capable")),
+            get_model_display_name(self.active_model),
+        ))
 
     # ─── File Selection ──────────────────────────────────────────────────────
 
@@ -124,7 +272,19 @@ class VocalsScreen(Screen):
             return
         if self._scan_timer is not None:
             self._scan_timer.stop()
-        self._scan_timer = self.set_timer(0.3, lambda: self._parse_and_scan(event.value))
+        self._scan_timer = self.set_timer(
+            self._scan_delay(event.value), lambda: self._parse_and_scan(event.value)
+        )
+
+    @staticmethod
+    def _scan_delay(text: str) -> float:
+        """Debounce for a keystroke: short input rescans fast, long paths wait."""
+        length = len(text.strip())
+        if length < 3:
+            return 0.15
+        if length <= 8:
+            return 0.3
+        return 0.5
 
     def on_input_submitted(self, event: Input.Submitted) -> None:
         if event.input.id != "path-input":
@@ -134,61 +294,93 @@ class VocalsScreen(Screen):
             self._start_separation(path)
 
     def _parse_and_scan(self, text: str) -> None:
-        """Parse input text into directory + filter, then launch a scan."""
-        text = text.strip().strip('"\'')
-        original_dir = os.environ.get('AMV_ORIGINAL_DIR', os.getcwd())
+        """Launch a scan for the input text; the worker works out what it names."""
+        self._run_scan(text.strip().strip('"\''))
 
-        if not text:
-            self._run_scan(original_dir, "")
-        elif os.path.isdir(text):
-            self._run_scan(text, "")
-        else:
-            dir_part = os.path.dirname(text)
-            name_part = os.path.basename(text).lower()
-            if dir_part and os.path.isdir(dir_part):
-                self._run_scan(dir_part, name_part)
-            else:
-                self._run_scan(original_dir, text.lower())
-
-    def _run_scan(self, directory: str, name_filter: str) -> None:
+    def _run_scan(self, text: str) -> None:
         """Show scanning indicator and launch background scan."""
         self.query_one("#path-scan-info", Static).update(
-            f"[dim]📁 {directory}  (scanning...)[/dim]"
+            f"[dim]📁 {self._scan_dir}  (scanning...)[/dim]"
         )
+        original_dir = get_original_dir()
+        # exclusive=True only cancels the worker object; the filesystem walk
+        # itself has to be told to stop
+        self._scan_cancel.set()
+        cancel = self._scan_cancel = threading.Event()
         self.run_worker(
-            lambda: self._scan_worker(directory, name_filter),
+            lambda: self._scan_worker(text, original_dir, cancel),
             thread=True, exclusive=True, group="path_scan",
         )
 
-    def _scan_worker(self, directory: str, name_filter: str) -> None:
-        """Run deep scan in background thread, then update UI."""
-        results = self._deep_scan(directory)
+    @staticmethod
+    def _resolve_input(text: str, original_dir: str) -> tuple[str, str]:
+        """Split input text into (directory to scan, lowercase name filter).
+
+        Directories are probed by opening them with os.scandir, which fails
+        for anything else, so a missing path costs one failed open.
+        """
+        if not text:
+            return original_dir, ""
+        for directory, name_filter in (
+            (text, ""), (os.path.dirname(text), os.path.basename(text).lower())
+        ):
+            if not directory:
+                continue
+            try:
+                os.scandir(directory).close()
+            except OSError:  # Not a directory, missing or unreadable
+                continue
+            return directory, name_filter
+        return original_dir, text.lower()
+
+    def _scan_worker(self, text: str, original_dir: str, cancel: threading.Event) -> None:
+        """Resolve the input and run deep scan in background thread, then update UI."""
+        # Path probes hit the disk, so they happen here rather than on the UI thread
+        directory, name_filter = self._resolve_input(text, original_dir)
+        with self._scan_lock:
+            cached = self._scan_cache.get(directory)
+        if cached is not None and time.monotonic() - cached[0] < SCAN_TTL:
+            stamp, results = cached
+        else:
+            stamp, results = time.monotonic(), self._deep_scan(directory, cancel)
+            if cancel.is_set():
+                return  # Partial, and a newer scan is already running
+        # Superseded workers keep running, so every access takes the lock
+        with self._scan_lock:
+            # Re-inserted so the dict stays in least-recently-used order
+            self._scan_cache.pop(directory, None)
+            self._scan_cache[directory] = (stamp, results)
+            while len(self._scan_cache) > SCAN_CACHE_SIZE:
+                self._scan_cache.pop(next(iter(self._scan_cache)))
         if name_filter:
             results = [f for f in results if name_filter in os.path.basename(f).lower()]
-        self.app.call_from_thread(self._show_scan_results, directory, results)
 
-    def _deep_scan(self, directory: str) -> list:
-        """Recursively scan for audio and video files."""
-        results = []
+        def show() -> None:
+            # Checked on the UI thread, where newer scans are started, so a
+            # superseded worker can't paint over their results
+            if not cancel.is_set():
+                self._show_scan_results(directory, results)
+
+        self.app.call_from_thread(show)
+
+    def _deep_scan(self, directory: str, cancel: threading.Event | None = None) -> list:
+        """Recursively scan for audio and video files, up to SCAN_LIMIT.
+
+        Setting cancel stops the walk at the next directory.
+        """
+        files = _iter_media_files(directory, cancel)
         try:
-            for root, dirs, files in os.walk(directory):
-                dirs[:] = [d for d in dirs if d not in SKIP_DIRS and not d.startswith('.')]
-                for f in files:
-                    ext = os.path.splitext(f)[1].lower().lstrip('.')
-                    if ext not in AUDIO_EXTENSIONS:
-                        continue
-                    f_lower = f.lower()
-                    if "[vocals]" in f_lower or "[instrumental]" in f_lower:
-                        continue
-                    results.append(os.path.join(root, f))
-                    if len(results) >= 200:
-                        return results
-        except OSError:
-            pass
+            # Pulling lazily means the walk stops as soon as the cap is hit
+            results = list(itertools.islice(files, SCAN_LIMIT))
+        finally:
+            files.close()
+        if cancel is not None and cancel.is_set():
+            return []
         return results
 
     def _show_scan_results(self, directory: str, results: list) -> None:
         """Update the suggestion list with scan results."""
+        self._scan_dir = directory
         self.query_one("#path-scan-info", Static).update(
             f"[dim]📁 {directory}  ({len(results)} files found)[/dim]"
         )
@@ -196,12 +388,16 @@ class VocalsScreen(Screen):
         menu = self.query_one("#path-suggestions", StyledOptionList)
         menu.clear_options()
 
-        for path in results[:20]:
-            name = os.path.basename(path)
-            parent = os.path.basename(os.path.dirname(path))
-            ext = os.path.splitext(name)[1].lower().lstrip('.')
-            emoji = "🎬" if ext in ('mp4', 'mkv', 'avi', 'webm', 'mov') else "🎵"
-            menu.add_option(create_menu_option(emoji, name, f"({parent})", "audio", f"file:{path}"))
+        options = []
+        add, make = options.append, create_menu_option
+        split, basename = os.path.split, os.path.basename
+        for path in results[:LIST_LIMIT]:
+            parent_dir, name = split(path)
+            dot = name.rfind('.')
+            emoji = "🎬" if dot > 0 and name[dot + 1:].lower() in VIDEO_EXTENSIONS else "🎵"
+            add(make(emoji, name, "(" + basename(parent_dir) + ")", "audio", "file:" + path))
+        # One add_options call refreshes the list once instead of per row
+        menu.add_options(options)
 
     # ─── Separation ───────────────────────────────────────────────────────────
 
@@ -296,8 +492,7 @@ class VocalsScreen(Screen):
         inp = self.query_one("#path-input", Input)
         inp.value = ""
         inp.focus()
-        original_dir = os.environ.get('AMV_ORIGINAL_DIR', os.getcwd())
-        self._run_scan(original_dir, "")
+        self._run_scan("")
 
     def action_go_back(self) -> None:
         if self.is_processing:
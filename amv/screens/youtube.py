@@ -31,6 +31,17 @@ _fh = logging.FileHandler(_log_file, encoding="utf-8")
 _fh.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(message)s"))
 _logger.addHandler(_fh)
 
+# Static menu, built once at import rather than on every compose
+_YOUTUBE_OPTIONS = (
+    create_menu_option("🎵", "Download Audio", "Extract as high-quality WAV", "audio", "audio"),
+    create_menu_option("🎬", "Download Video", "Best quality MP4", "video", "video"),
+    create_separator(),
+    create_menu_option("📂", "Open video folder", "", "folder", "open_video"),
+    create_menu_option("📂", "Open audio folder", "", "folder", "open_audio"),
+    create_separator(),
+    create_menu_option("⬅️", "Back to Main Menu", "", "back", "back"),
+)
+
 
 class YouTubeScreen(Screen):
     """YouTube download screen with URL input and format selection."""
@@ -61,16 +72,7 @@ class YouTubeScreen(Screen):
 
             # Menu for mode selection
             with Center():
-                yield StyledOptionList(
-                    create_menu_option("🎵", "Download Audio", "Extract as high-quality WAV", "audio", "audio"),
-                    create_menu_option("🎬", "Download Video", "Best quality MP4", "video", "video"),
-                    create_separator(),
-                    create_menu_option("📂", "Open video folder", "", "folder", "open_video"),
-                    create_menu_option("📂", "Open audio folder", "", "folder", "open_audio"),
-                    create_separator(),
-                    create_menu_option("⬅️", "Back to Main Menu", "", "back", "back"),
-                    id="youtube-menu"
-                )
+                yield StyledOptionList(*_YOUTUBE_OPTIONS, id="youtube-menu")
             
             # URL input (hidden initially, shown when audio/video selected)
             with Vertical(id="input-section", classes="hidden"):
@@ -95,24 +97,39 @@ class YouTubeScreen(Screen):
         """Focus the menu on mount."""
         self.query_one("#youtube-menu").focus()
     
+    def _handle_audio(self) -> None:
+        self.download_mode = "audio"
+        self._show_input()
+
+    def _handle_video(self) -> None:
+        self.download_mode = "video"
+        self._show_input()
+
+    def _handle_open_video(self) -> None:
+        dirs = ensure_output_dirs()
+        self._open_folder(dirs["video"])
+
+    def _handle_open_audio(self) -> None:
+        dirs = ensure_output_dirs()
+        self._open_folder(dirs["audio"])
+
+    def _handle_back(self) -> None:
+        self.action_go_back()
+
+    # Menu option id -> handler, looked up once per selection
+    _HANDLERS = {
+        "audio": _handle_audio,
+        "video": _handle_video,
+        "open_video": _handle_open_video,
+        "open_audio": _handle_open_audio,
+        "back": _handle_back,
+    }
+
     def on_option_list_option_selected(self, event) -> None:
         """Handle menu selection."""
-        option_id = event.option_id
-        
-        if option_id == "audio":
-            self.download_mode = "audio"
-            self._show_input()
-        elif option_id == "video":
-            self.download_mode = "video"
-            self._show_input()
-        elif option_id == "open_video":
-            dirs = ensure_output_dirs()
-            self._open_folder(dirs["video"])
-        elif option_id == "open_audio":
-            dirs = ensure_output_dirs()
-            self._open_folder(dirs["audio"])
-        elif option_id == "back":
-            self.action_go_back()
+        handler = self._HANDLERS.get(event.option_id)
+        if handler is not None:
+            handler(self)
     
     def _show_input(self) -> None:
         """Show the URL input section."""
@@ -140,9 +157,16 @@ class YouTubeScreen(Screen):
     def _open_folder(self, path: str) -> None:
         """Open folder in file explorer."""
         if os.name == 'nt':
-            os.startfile(path)
+            os.startfile(path)  # Already non-blocking
         else:
-            subprocess.run(['xdg-open', path])
+            # Fire-and-forget so the UI doesn't wait for the file manager
+            subprocess.Popen(
+                ['xdg-open', path],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
+            )
     
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
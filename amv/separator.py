@@ -7,11 +7,13 @@ import sys
 import io
 import re
 import logging
+from pathlib import Path
 from typing import Callable, Optional
 
 from .config import MODELS_DIR, ensure_output_dirs, add_recent_file
 from .models import get_model_settings, get_active_model
 from .hardware import get_hw_info
+from .media import probe_duration
 
 
 class TqdmCapture(io.StringIO):
@@ -48,6 +50,17 @@ class TqdmCapture(io.StringIO):
         super().flush()
 
 
+def preload() -> None:
+    """Import the separation backend (torch/onnxruntime) ahead of first use.
+
+    Failures are ignored; run_separation hits the same import and reports it.
+    """
+    try:
+        import audio_separator.separator  # noqa: F401
+    except Exception:
+        pass
+
+
 def run_separation(
     input_file: str,
     model_name: str = None,
@@ -92,10 +105,15 @@ def run_separation(
     original_duration_ms = 0
 
     try:
-        # Padding logic (Silent background op)
+        # Padding logic (Silent background op). Probe the length first so
+        # only short clips, which actually need padding, get fully decoded.
         if PYDUB_OK:
-            audio = AudioSegment.from_file(input_file)
-            original_duration_ms = len(audio)
+            duration_s = probe_duration(input_file)
+            if duration_s is None or duration_s < 10:
+                audio = AudioSegment.from_file(input_file)
+                original_duration_ms = len(audio)
+            else:
+                original_duration_ms = int(duration_s * 1000)
             if original_duration_ms < 10000:
                 padding = 10000 - original_duration_ms + 1000
                 padded = audio + AudioSegment.silent(duration=padding)
@@ -125,6 +143,7 @@ def run_separation(
         if model_settings.get("fp16") and hw.get("gpu_type") != "cpu":
             sep_config["use_autocast"] = True
 
+        Path(MODELS_DIR).mkdir(parents=True, exist_ok=True)
         separator = Separator(**sep_config)
 
         # Notify loading stage
@@ -3,6 +3,9 @@
 # Animated ASCII banner with gradient colors
 # ═══════════════════════════════════════════════════════════════════════════════
 
+import functools
+import itertools
+
 from textual.widget import Widget
 from textual.app import ComposeResult
 from textual.widgets import Static
@@ -35,6 +38,34 @@ GRADIENT_COLORS = [
 ]
 
 
+def _dim_color(hex_color: str) -> str:
+    """Darken a hex color for shadow/border effect."""
+    r = int(hex_color[1:3], 16)
+    g = int(hex_color[3:5], 16)
+    b = int(hex_color[5:7], 16)
+    factor = 0.35
+    return f"#{int(r*factor):02x}{int(g*factor):02x}{int(b*factor):02x}"
+
+
+@functools.cache
+def _gradient_logo() -> Text:
+    """Create gradient-colored logo with block characters.
+
+    The logo never changes, so it is built once per process. Runs of the
+    same character are appended as one span rather than one per cell.
+    """
+    text = Text()
+    lines = [line for line in LOGO.split('\n') if '█' in line or '▒' in line]
+    max_len = max(len(line) for line in lines)
+    for i, line in enumerate(lines):
+        color = GRADIENT_COLORS[i % len(GRADIENT_COLORS)]
+        styles = {'█': Style(bgcolor=color), '▒': Style(bgcolor=_dim_color(color))}
+        for char, run in itertools.groupby(line.ljust(max_len)):
+            text.append(' ' * len(list(run)), style=styles.get(char))
+        text.append('\n')
+    return text
+
+
 class Banner(Widget):
     """Animated ASCII banner widget with gradient text."""
     
@@ -47,31 +78,5 @@ class Banner(Widget):
     """
     
     def compose(self) -> ComposeResult:
-        yield Static(self._create_gradient_logo(), id="banner")
+        yield Static(_gradient_logo(), id="banner")
         yield Static(f"[bold dim]{TAGLINE}[/bold dim]", id="tagline")
-    
-    def _dim_color(self, hex_color: str) -> str:
-        """Darken a hex color for shadow/border effect."""
-        r = int(hex_color[1:3], 16)
-        g = int(hex_color[3:5], 16)
-        b = int(hex_color[5:7], 16)
-        factor = 0.35
-        return f"#{int(r*factor):02x}{int(g*factor):02x}{int(b*factor):02x}"
-
-    def _create_gradient_logo(self) -> Text:
-        """Create gradient-colored logo with block characters."""
-        text = Text()
-        lines = [line for line in LOGO.split('\n') if '█' in line or '▒' in line]
-        max_len = max(len(line) for line in lines)
-        lines = [line.ljust(max_len) for line in lines]
-        for i, line in enumerate(lines):
-            color = GRADIENT_COLORS[i % len(GRADIENT_COLORS)]
-            for char in line:
-                if char == '█':
-                    text.append(' ', style=Style(bgcolor=color))
-                elif char == '▒':
-                    text.append(' ', style=Style(bgcolor=self._dim_color(color)))
-                else:
-                    text.append(' ')
-            text.append('\n')
-        return text
@@ -3,6 +3,9 @@
 # Color-coded option list with category styling
 # ═══════════════════════════════════════════════════════════════════════════════
 
+import sys
+import functools
+
 from textual.widgets import OptionList
 from textual.widgets.option_list import Option
 from rich.text import Text
@@ -38,7 +41,19 @@ def create_menu_option(
         value: Return value when selected (defaults to label)
     """
     color = CATEGORY_COLORS.get(category, CATEGORY_COLORS["action"])
-    
+    text = _menu_prompt(icon, label, description, color)
+    # Interned so dispatch-table lookups on the selected id compare by identity
+    option_id = sys.intern(value or label.lower().replace(" ", "_"))
+    return Option(text, id=option_id)
+
+
+@functools.lru_cache(maxsize=64)
+def _menu_prompt(icon: str, label: str, description: str, color: str) -> Text:
+    """Build the styled prompt text; cached since menus reuse the same entries.
+
+    Only the Text is cached - Option objects hold per-list state, so
+    create_menu_option() always wraps it in a fresh one.
+    """
     text = Text()
     text.append(f"{icon}  ", style=f"bold {color}")
     text.append(label, style=f"bold {color}")
@@ -46,7 +61,7 @@ def create_menu_option(
     if description:
         text.append(f"  {description}", style="dim")
     
-    return Option(text, id=value or label.lower().replace(" ", "_"))
+    return text
 
 
 def create_separator():
@@ -0,0 +1,71 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from amv import config
+
+
+class ConfigCacheTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._tmp.name, "config.json")
+        self._patch = patch.object(config, "CONFIG_FILE", self.path)
+        self._patch.start()
+        config._CFG_CACHE.update(key=None, value=None)
+        config._LAST_WRITTEN.update(key=None, digest=None)
+
+    def tearDown(self):
+        self._patch.stop()
+        config._CFG_CACHE.update(key=None, value=None)
+        config._LAST_WRITTEN.update(key=None, digest=None)
+        self._tmp.cleanup()
+
+    def test_repeat_loads_skip_parsing(self):
+        config.save_config({"recent_files": ["a.wav"]})
+
+        with patch("amv.config._loads", side_effect=AssertionError("re-parsed")):
+            first = config.load_config()
+            second = config.load_config()
+
+        self.assertEqual(first["recent_files"], ["a.wav"])
+        self.assertEqual(first, second)
+
+    def test_returned_config_is_a_copy(self):
+        config.save_config({"recent_files": ["a.wav"]})
+
+        config.load_config()["recent_files"].append("b.wav")
+
+        self.assertEqual(config.load_config()["recent_files"], ["a.wav"])
+
+    def test_external_edit_invalidates_cache(self):
+        config.save_config({"recent_files": ["a.wav"]})
+        config.load_config()
+
+        with open(self.path, "w") as f:
+            json.dump({"recent_files": ["changed.wav", "other.wav"]}, f)
+
+        self.assertEqual(config.load_config()["recent_files"], ["changed.wav", "other.wav"])
+
+    def test_unchanged_save_skips_write(self):
+        config.save_config({"recent_files": ["a.wav"]})
+        config._LAST_WRITTEN.update(key=None, digest=None)
+
+        with patch("amv.config.open", side_effect=open) as mock_open:
+            config.save_config({"recent_files": ["a.wav"]})
+
+        modes = [call.args[1] for call in mock_open.call_args_list]
+        self.assertNotIn("wb", modes)
+
+    def test_written_format_does_not_depend_on_orjson(self):
+        cfg = {"recent_files": ["a.wav"], "force_cpu": False}
+        with patch.object(config, "ORJSON_OK", False):
+            plain = config._dumps(cfg)
+        with patch.object(config, "ORJSON_OK", True):
+            self.assertEqual(config._dumps(cfg), plain)
+        self.assertEqual(plain, json.dumps(cfg, indent=4).encode("utf-8"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,23 @@
+import os
+import unittest
+
+from amv.screens.convert import _plan_batch, _wav_output_path
+
+
+class ConvertBatchPlanTests(unittest.TestCase):
+    def test_output_path(self):
+        self.assertEqual(_wav_output_path(os.path.join("d", "a.mkv")), os.path.join("d", "a.wav"))
+        self.assertEqual(_wav_output_path(os.path.join("d", "a.WAV")), os.path.join("d", "a_converted.wav"))
+
+    def test_colliding_outputs_and_outputs_as_inputs_are_skipped(self):
+        files = [os.path.join("lib", name) for name in
+                 ("clip.mp4", "clip.mkv", "in.wav", "in.mkv", "solo.flac")]
+
+        planned, skipped = _plan_batch(files)
+
+        self.assertEqual(planned, [os.path.join("lib", n) for n in ("clip.mp4", "in.mkv", "solo.flac")])
+        self.assertEqual(skipped, [os.path.join("lib", n) for n in ("clip.mkv", "in.wav")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from amv import gpu
+
+
+class NvidiaHardwareGateTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        gpu.has_nvidia_hw.cache_clear()
+
+    def tearDown(self):
+        gpu.has_nvidia_hw.cache_clear()
+        self._tmp.cleanup()
+
+    def _vendors(self, *ids):
+        paths = []
+        for i, vendor in enumerate(ids):
+            path = os.path.join(self._tmp.name, f"vendor{i}")
+            with open(path, "w", encoding="ascii") as f:
+                f.write(f"{vendor}\n")
+            paths.append(path)
+        return paths
+
+    def _check(self, paths):
+        with patch.object(gpu.sys, "platform", "linux"), \
+             patch.object(gpu.os, "uname", return_value=os.uname_result(("Linux", "h", "6.1", "", "x86_64"))), \
+             patch.object(gpu.glob, "glob", return_value=paths):
+            return gpu.has_nvidia_hw()
+
+    def test_nvidia_vendor_found(self):
+        self.assertTrue(self._check(self._vendors("0x8086", "0x10de")))
+
+    def test_no_nvidia_skips_detection(self):
+        self.assertFalse(self._check(self._vendors("0x8086", "0x1002")))
+        with patch.object(gpu, "_nvidia_smi_info", side_effect=AssertionError("spawned")):
+            self.assertIsNone(gpu.check_nvidia_gpu())
+
+    def test_unknown_when_sysfs_empty(self):
+        self.assertTrue(self._check([]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from amv import hardware
+
+
+class HardwareCacheTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._tmp.name, "_hw_cache.json")
+        self._patches = [
+            patch.object(hardware, "HW_CACHE_FILE", self.path),
+            patch.object(hardware, "_cache_signature", return_value={"version": 0}),
+        ]
+        for p in self._patches:
+            p.start()
+        self._saved = dict(hardware._CACHE)
+
+    def tearDown(self):
+        for p in self._patches:
+            p.stop()
+        hardware._CACHE.clear()
+        hardware._CACHE.update(self._saved)
+        self._tmp.cleanup()
+
+    def _detect(self, persist):
+        def detect(config):
+            hardware._CACHE["checked"] = True
+            return persist
+        return patch.object(hardware, "_detect", side_effect=detect)
+
+    def test_transient_failure_is_not_saved(self):
+        with self._detect(False):
+            hardware._load_or_detect({})
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_saved_result_is_reused_unless_forced(self):
+        with self._detect(True):
+            hardware._load_or_detect({})
+        self.assertTrue(os.path.exists(self.path))
+        self.assertFalse(os.path.exists(self.path + ".tmp"))
+
+        with self._detect(True) as detect:
+            hardware._load_or_detect({})
+            detect.assert_not_called()
+            hardware._load_or_detect({}, force=True)
+            detect.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import sys
+import unittest
+
+from amv.gpu import get_cpu_switch_cmds, get_gpu_switch_cmds, get_torch_install_cmd
+from amv.screens.setup import _dist_name, _pip_error_message, _plan_installs
+
+PY = sys.executable
+
+
+class InstallPlanTests(unittest.TestCase):
+    def test_pypi_installs_merge_but_custom_index_stays_separate(self):
+        installs = [
+            get_torch_install_cmd(False),
+            [PY, "-m", "pip", "install", "onnxruntime"],
+            [PY, "-m", "pip", "install", "yt-dlp"],
+            [PY, "-m", "pip", "install", "audio-separator"],
+        ]
+
+        planned = _plan_installs(installs)
+
+        self.assertEqual(planned, [
+            list(get_torch_install_cmd(False)),
+            [PY, "-m", "pip", "install", "onnxruntime", "yt-dlp", "audio-separator"],
+        ])
+
+    def test_uninstall_is_kept_in_place(self):
+        planned = _plan_installs(list(get_gpu_switch_cmds()))
+
+        self.assertEqual([list(cmd) for cmd in planned],
+                         [list(cmd) for cmd in get_gpu_switch_cmds()])
+
+    def test_switch_installs_torch_only_from_its_index(self):
+        for gpu, cmds in ((True, get_gpu_switch_cmds()), (False, get_cpu_switch_cmds())):
+            planned = _plan_installs(list(cmds))
+            self.assertEqual(planned[1], list(get_torch_install_cmd(gpu)))
+            for cmd in planned[2:]:
+                self.assertNotIn("torch", cmd)
+                self.assertFalse(any("index-url" in arg for arg in cmd))
+
+    def test_uv_runs_installs_against_this_interpreter(self):
+        uninstall, torch, separator = get_gpu_switch_cmds()
+
+        planned = _plan_installs([uninstall, torch, separator], uv="uv")
+
+        self.assertEqual(planned[0], uninstall)
+        self.assertEqual(planned[1][:5], ["uv", "pip", "install", "--python", PY])
+        self.assertEqual(planned[1][5:], list(torch[4:]))
+        self.assertEqual(planned[2][5:], list(separator[4:]))
+
+    def test_dist_name_strips_extras_and_normalizes(self):
+        self.assertEqual(_dist_name("audio-separator[gpu]"), "audio-separator")
+        self.assertEqual(_dist_name("Audio_Separator>=0.30"), "audio-separator")
+        self.assertEqual(_dist_name("yt.dlp"), "yt-dlp")
+
+    def test_pip_error_prefers_error_lines_over_notices(self):
+        tail = [
+            "Collecting torch",
+            "ERROR: No matching distribution found for torch==9.9",
+            "[notice] A new release of pip is available: 24.0 -> 25.0",
+            "[notice] To update, run: python -m pip install --upgrade pip",
+        ]
+        self.assertEqual(
+            _pip_error_message(tail, 1),
+            "ERROR: No matching distribution found for torch==9.9",
+        )
+        self.assertEqual(_pip_error_message(["", "[notice] x"], 2), "exit code 2")
+
+
+if __name__ == "__main__":
+    unittest.main()
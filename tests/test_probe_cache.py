@@ -0,0 +1,37 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from amv.screens import setup
+
+
+class ProbeCacheTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self._patch = patch.object(
+            setup, "PROBE_CACHE_FILE", os.path.join(self._tmp.name, "probe.json")
+        )
+        self._patch.start()
+        setup._PROBE_CACHE = None
+
+    def tearDown(self):
+        self._patch.stop()
+        setup._PROBE_CACHE = None
+        self._tmp.cleanup()
+
+    def test_result_reused_from_disk_while_signature_matches(self):
+        sig = ["python", [1, 2]]
+        self.assertTrue(setup._probe_cached("torch", sig, lambda: True))
+
+        setup._PROBE_CACHE = None  # force a reload from disk
+        fail = lambda: self.fail("re-probed")
+        self.assertTrue(setup._probe_cached("torch", sig, fail))
+
+    def test_changed_signature_reprobes(self):
+        setup._probe_cached("torch", ["python", [1, 2]], lambda: True)
+        self.assertFalse(setup._probe_cached("torch", ["python", [3, 2]], lambda: False))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from amv import scan_cache
+from amv.screens.convert import ConvertScreen
+
+
+class ScanCacheTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = os.path.join(self._tmp.name, "library")
+        self.nested = os.path.join(self.root, "show", "season1")
+        os.makedirs(self.nested)
+        open(os.path.join(self.nested, "ep1.mkv"), "w").close()
+
+        self._patch = patch.object(
+            scan_cache, "SCAN_CACHE_FILE", os.path.join(self._tmp.name, "scan.json")
+        )
+        self._patch.start()
+        scan_cache._ENTRIES = None
+        self.scan = ConvertScreen()._deep_scan
+
+    def tearDown(self):
+        self._patch.stop()
+        scan_cache._ENTRIES = None
+        self._tmp.cleanup()
+
+    def test_unchanged_tree_skips_scan(self):
+        first = scan_cache.get_or_scan(self.root, self.scan)
+
+        scan_cache._ENTRIES = None  # force a reload from disk
+        fail = lambda *args: self.fail("re-scanned")
+        second = scan_cache.get_or_scan(self.root, fail)
+
+        self.assertEqual(first, (os.path.join(self.nested, "ep1.mkv"),))
+        self.assertEqual(first, second)
+
+    def test_nested_change_invalidates(self):
+        scan_cache.get_or_scan(self.root, self.scan)
+
+        open(os.path.join(self.nested, "ep2.mkv"), "w").close()
+        st = os.stat(self.nested)
+        os.utime(self.nested, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        results = scan_cache.get_or_scan(self.root, self.scan)
+        self.assertEqual(len(results), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
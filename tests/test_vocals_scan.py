@@ -0,0 +1,93 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from amv.screens import vocals
+from amv.screens.vocals import VocalsScreen
+
+
+class VocalsScanTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = self._tmp.name
+        for sub in ("show/season1", ".git", "node_modules"):
+            os.makedirs(os.path.join(self.root, sub))
+        for name in (
+            "song.mp3", "show/clip.MKV", "show/season1/ep1.wav",
+            "show/season1/ep1 [vocals].wav", "show/season1/ep1 [Instrumental].wav",
+            ".git/hook.mp3", "node_modules/beep.mp3", "show/notes.txt",
+        ):
+            open(os.path.join(self.root, name), "w").close()
+        self.scan = VocalsScreen()._deep_scan
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_finds_media_and_skips_outputs(self):
+        found = sorted(os.path.relpath(p, self.root) for p in self.scan(self.root))
+        self.assertEqual(found, [
+            os.path.join("show", "clip.MKV"),
+            os.path.join("show", "season1", "ep1.wav"),
+            "song.mp3",
+        ])
+
+    def test_missing_directory(self):
+        self.assertEqual(list(self.scan(os.path.join(self.root, "gone"))), [])
+
+    @unittest.skipUnless(hasattr(os, "symlink"), "needs symlinks")
+    def test_only_regular_files_and_links_to_them(self):
+        show = os.path.join(self.root, "show")
+        try:
+            os.symlink(os.path.join(show, "clip.MKV"), os.path.join(self.root, "link.mkv"))
+            os.symlink(os.path.join(self.root, "gone.mp3"), os.path.join(self.root, "dangling.mp3"))
+        except OSError:
+            self.skipTest("symlinks not permitted")
+        if hasattr(os, "mkfifo"):
+            os.mkfifo(os.path.join(self.root, "pipe.wav"))
+
+        found = {os.path.relpath(p, self.root) for p in self.scan(self.root)}
+        self.assertIn("link.mkv", found)
+        self.assertNotIn("dangling.mp3", found)
+        self.assertNotIn("pipe.wav", found)
+
+    def test_directory_reached_twice_is_walked_once(self):
+        # Stand-in for a bind mount: "deeper/alias" reports the same identity
+        # as "show", which breadth-first order reaches first
+        show = os.path.join(self.root, "show")
+        alias = os.path.join(self.root, "deeper", "alias")
+        os.makedirs(alias)
+        open(os.path.join(alias, "copy.mp3"), "w").close()
+        real_stat = os.stat
+
+        def fake_stat(path, *args, **kwargs):
+            return real_stat(show if path == alias else path, *args, **kwargs)
+
+        with mock.patch("amv.screens.vocals.os.stat", fake_stat):
+            found = {os.path.relpath(p, self.root) for p in self.scan(self.root)}
+        self.assertIn(os.path.join("show", "clip.MKV"), found)
+        self.assertNotIn(os.path.join("deeper", "alias", "copy.mp3"), found)
+
+    def test_scans_share_one_pool(self):
+        # Stopping a scan early must leave the shared pool usable
+        files = vocals._iter_media_files(self.root)
+        next(files)
+        files.close()
+        pool = vocals._scan_pool()
+        self.assertEqual(len(list(self.scan(self.root))), 3)
+        self.assertIs(vocals._scan_pool(), pool)
+
+    def test_resolve_input(self):
+        resolve = VocalsScreen._resolve_input
+        show = os.path.join(self.root, "show")
+        self.assertEqual(resolve("", "/orig"), ("/orig", ""))
+        self.assertEqual(resolve(show, "/orig"), (show, ""))
+        self.assertEqual(resolve(os.path.join(show, "Cl"), "/orig"), (show, "cl"))
+        self.assertEqual(
+            resolve(os.path.join(show, "clip.MKV"), "/orig"), (show, "clip.mkv")
+        )
+        self.assertEqual(resolve("Song", "/orig"), ("/orig", "song"))
+
+
+if __name__ == "__main__":
+    unittest.main()